@@ -16,14 +16,23 @@ import os
 import json
 import subprocess
 import tempfile
-import shutil
 import threading
 import queue
+import multiprocessing
+from collections import OrderedDict, deque
+import math
+import functools
+import itertools
+import hashlib
+import struct
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 import re
 
+import numpy as np
+
 # PyQt6 imports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -33,11 +42,11 @@ from PyQt6.QtWidgets import (
     QGridLayout, QSizePolicy, QSpacerItem, QRadioButton, QButtonGroup
 )
 from PyQt6.QtCore import (
-    Qt, QThread, pyqtSignal, QTimer, QSize, QUrl, QSettings
+    Qt, QObject, pyqtSignal, QTimer, QSize, QUrl, QSettings, QSignalBlocker
 )
 from PyQt6.QtGui import (
     QFont, QIcon, QDragEnterEvent, QDropEvent, QColor, QPalette,
-    QLinearGradient, QBrush, QPainter, QFontDatabase
+    QLinearGradient, QBrush, QPainter, QFontDatabase, QPixmap, QDesktopServices
 )
 
 # Application metadata
@@ -49,9 +58,72 @@ APP_AUTHOR = "Kimi Claw for Jud Smith"
 BUNDLE_DIR = Path(__file__).parent.parent if ".app" in str(Path(__file__)) else Path(__file__).parent
 EXPORTS_DIR = Path.home() / "Desktop" / "FlowState Exports"
 TEMP_DIR = Path(tempfile.gettempdir()) / "flowstate"
+METADATA_CACHE_PATH = TEMP_DIR.parent / "flowstate_meta.json"
+CLIP_CACHE_DIR = TEMP_DIR.parent / "flowstate_clips"
+
+# Accepted file types for drops, matched on the lower-cased extension
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".flac", ".aac", ".m4a", ".ogg"})
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+
+# Lines of ffmpeg stderr kept for error messages
+FFMPEG_ERROR_TAIL_LINES = 100
+
+# Threads for ffmpeg filter graphs and the video encoder
+CPU_COUNT = os.cpu_count() or 4
+
+# H.264 encoders in order of preference. "global" args go before the inputs,
+# "filter" is appended to the video filter chain (hardware upload), "clip"
+# overrides the tuning for the short constant clips (no lookahead needed).
+VIDEO_ENCODERS = {
+    "h264_videotoolbox": {
+        "args": ["-c:v", "h264_videotoolbox", "-b:v", "6M", "-pix_fmt", "yuv420p"],
+        "clip": ["-realtime", "1"],
+    },
+    "h264_nvenc": {
+        "args": ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq",
+                 "-rc", "vbr", "-cq", "23", "-b:v", "0", "-pix_fmt", "yuv420p"],
+        "clip": ["-tune", "ll", "-delay", "0"],
+    },
+    "h264_qsv": {
+        "args": ["-c:v", "h264_qsv", "-preset", "medium", "-global_quality", "23", "-pix_fmt", "nv12"],
+    },
+    "h264_vaapi": {
+        "global": ["-vaapi_device", "/dev/dri/renderD128"],
+        "filter": "format=nv12,hwupload",
+        "args": ["-c:v", "h264_vaapi", "-qp", "23"],
+    },
+    "libx264": {
+        "args": ["-c:v", "libx264", "-preset", "medium", "-crf", "23", "-pix_fmt", "yuv420p"],
+        "clip": ["-tune", "zerolatency"],
+    },
+}
+
+# Length of the short clips that black-screen and still-image videos are
+# stream-copied from
+CLIP_SECONDS = 10
+CLIP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Audio render settings
+MASTER_SAMPLE_RATE = 48000
+# aloop holds the whole sequence in memory (~1.4 GB per hour as s32 stereo),
+# so longer sequences are looped from a FLAC temp on disk instead
+ALOOP_MAX_SECONDS = 600
+
+# ebur128 summary parsing
+_I_RE = re.compile(r'I:\s*([-\d.]+)\s*LUFS')
+_PEAK_RE = re.compile(r'Peak:\s*([-\d.]+)')
+
+# Input header parsing, so non-WAV files don't need a separate ffprobe run
+_DURATION_RE = re.compile(r'Duration:\s*(\d+):(\d+):([\d.]+)')
+_AUDIO_STREAM_RE = re.compile(r'Audio:.*?(\d+) Hz, ([^,]+)')
+
+# Characters dropped from project names when building file names; \w is
+# Unicode-aware, so this keeps exactly alphanumerics plus "-_ "
+_UNSAFE_NAME_RE = re.compile(r'[^\w\- ]')
 
 EXPORTS_DIR.mkdir(exist_ok=True)
 TEMP_DIR.mkdir(exist_ok=True)
+CLIP_CACHE_DIR.mkdir(exist_ok=True)
 
 
 class StatusPanel(QFrame):
@@ -201,6 +273,15 @@ class StatusPanel(QFrame):
             name.setStyleSheet("color: white; font-size: 10px;")
             icon.setText("✓")
     
+    def set_all_stages_complete(self):
+        """Mark every stage complete with a single repaint"""
+        self.setUpdatesEnabled(False)
+        try:
+            for stage_id in self.stage_labels:
+                self.set_stage_complete(stage_id)
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def update_progress(self, message: str, percent: int, step: int, total: int):
         """Update progress display"""
         self.current_op.setText(f"Step {step}/{total}: {message}")
@@ -256,6 +337,286 @@ BINAURAL_PRESETS = {
     }
 }
 
+# Preset descriptions for the binaural page; the presets never change, so the
+# markup is built once
+PRESET_INFO_HTML = {
+    key: f"""
+        <b>Base:</b> {preset['base']} Hz | <b>Beat:</b> {preset['beat']} Hz<br><br>
+        {preset['description']}
+        """
+    for key, preset in BINAURAL_PRESETS.items()
+}
+
+# Video modes offered on the video page: (id, title, description)
+VIDEO_MODES = (
+    ("black_screen", "⬛ Black Screen", "Simple black screen, optional intro text"),
+    ("images", "🖼️ Image Slideshow", "Fade between uploaded images"),
+    ("hybrid", "🔀 Hybrid", "Intro → Black → Images → Black"),
+    ("audio_only", "🔊 Audio Only", "Just the audio file, no video"),
+)
+
+# Text of the exported YouTube metadata file
+YOUTUBE_METADATA_TEMPLATE = """YOUTUBE UPLOAD METADATA
+{sep}
+
+TITLE:
+{{title}}
+
+DESCRIPTION:
+{{description}}
+
+TAGS:
+{{tags}}
+
+CATEGORY:
+Music
+
+SETTINGS:
+• Made for kids: No
+• License: Standard YouTube License
+• Comments: Allow all comments
+
+AUDIO SPECS:
+• Duration: {{duration}} minutes
+• Binaural: {{preset}}
+• Loudness: {{loudness}} LUFS
+
+Exported by FlowState Audio
+https://github.com/lizardflaco/flowstate-audio
+""".format(sep="=" * 50)
+
+
+# Color of the track number badges
+TRACK_BADGE_COLOR = BINAURAL_PRESETS.get('delta_deep_sleep', {}).get('color', '#8B5CF6')
+
+# Widget styles, applied once app-wide in main() and matched by class and
+# object name, so widgets don't each re-parse their own stylesheet
+APP_STYLESHEET = """
+    #pageStack, #pageStack QWidget {
+        background-color: #0a0a0f;
+    }
+    #pageStack QLabel#pageHeader {
+        color: #e8e8f0; font-size: 28px; font-weight: 600;
+    }
+    #pageStack QLabel#pageDescription {
+        color: #6b7280; font-size: 14px;
+    }
+    #pageStack QLabel[role="field"] {
+        color: #9ca3af;
+    }
+    #pageStack QLabel[role="hint"] {
+        color: #6b7280; font-size: 12px;
+    }
+    #pageStack QLabel[role="optionHint"] {
+        color: #6b7280; font-size: 12px; padding-left: 28px;
+    }
+    #pageStack QLabel[role="tip"] {
+        color: #6b7280; font-size: 11px;
+    }
+    #pageStack QGroupBox {
+        color: #8B5CF6;
+        font-weight: 600;
+        border: 1px solid #1e1e2e;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 12px;
+    }
+    #pageStack QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px;
+    }
+    #pageStack QLineEdit, #pageStack QTextEdit,
+    #pageStack QSpinBox, #pageStack QDoubleSpinBox {
+        background-color: #1e1e2e;
+        color: #e8e8f0;
+        border: 1px solid #2d2d3d;
+        border-radius: 6px;
+        padding: 8px;
+    }
+    #pageStack QLineEdit {
+        padding: 8px 12px;
+    }
+    #pageStack QRadioButton {
+        color: #e8e8f0;
+        font-size: 14px;
+        padding: 8px;
+    }
+    #pageStack QRadioButton::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    #pageStack QCheckBox {
+        color: #e8e8f0;
+    }
+    #pageStack QCheckBox#loopCheckbox {
+        font-size: 14px;
+    }
+    #pageStack QPushButton#browseButton {
+        background-color: #1e1e2e;
+        color: #9ca3af;
+        padding: 12px 24px;
+        border: none;
+        border-radius: 8px;
+    }
+    #pageStack QPushButton#browseButton:hover {
+        background-color: #252542;
+        color: #e8e8f0;
+    }
+    #pageStack QComboBox {
+        background-color: #1e1e2e;
+        color: #e8e8f0;
+        border: 1px solid #2d2d3d;
+        border-radius: 6px;
+        padding: 8px 12px;
+        min-width: 300px;
+    }
+    #pageStack QComboBox::drop-down {
+        border: none;
+        padding-right: 12px;
+    }
+    #pageStack QComboBox QAbstractItemView {
+        background-color: #1e1e2e;
+        color: #e8e8f0;
+        selection-background-color: #8B5CF6;
+    }
+    #pageStack QLabel#presetInfo {
+        color: #9ca3af;
+        font-size: 13px;
+        padding: 12px;
+        background-color: #1e1e2e;
+        border-radius: 6px;
+    }
+    #pageStack QLabel#volumeLabel {
+        color: #e8e8f0; min-width: 50px;
+    }
+    #pageStack QSlider::groove:horizontal {
+        height: 6px;
+        background: #1e1e2e;
+        border-radius: 3px;
+    }
+    #pageStack QSlider::handle:horizontal {
+        background: #8B5CF6;
+        width: 18px;
+        height: 18px;
+        border-radius: 9px;
+        margin: -6px 0;
+    }
+    #pageStack QSlider::sub-page:horizontal {
+        background: #8B5CF6;
+        border-radius: 3px;
+    }
+    
+    DropZone#dropZone {
+        background-color: #1a1a2e;
+        border: 2px dashed #3d3d5c;
+        border-radius: 12px;
+    }
+    DropZone#dropZone:hover, DropZone#dropZone[dragging="true"] {
+        border-color: #8B5CF6;
+        background-color: #252542;
+    }
+    DropZone QLabel#dropTitle {
+        color: #e8e8f0; font-size: 16px; font-weight: 500;
+    }
+    DropZone QLabel#dropSubtitle {
+        color: #6b7280; font-size: 12px;
+    }
+    
+    TrackListWidget#trackList {
+        background-color: transparent;
+    }
+    QFrame#trackRow, QFrame#trackRow QFrame {
+        background-color: #252542;
+        border-radius: 8px;
+        padding: 8px;
+    }
+    QFrame#trackRow QLabel#trackBadge {
+        background-color: transparent;
+        padding: 0px;
+    }
+    QFrame#trackRow QLabel#trackName {
+        color: #e8e8f0; font-weight: 500;
+    }
+    QFrame#trackRow QLabel#trackMeta {
+        color: #6b7280; font-size: 11px;
+    }
+    QPushButton#trackRemove {
+        background-color: transparent;
+        color: #ef4444;
+        border: none;
+        font-size: 14px;
+    }
+    QPushButton#trackRemove:hover {
+        background-color: rgba(239, 68, 68, 0.2);
+        border-radius: 4px;
+    }
+    
+    QWidget#sidebar, QWidget#sidebar QLabel {
+        background-color: #12121a;
+        border-right: 1px solid #1e1e2e;
+    }
+    QWidget#sidebar QLabel#logo {
+        color: #8B5CF6;
+        font-size: 20px;
+        font-weight: 600;
+        padding-bottom: 8px;
+    }
+    QWidget#sidebar QLabel#sidebarSubtitle {
+        color: #6b7280; font-size: 12px; padding-bottom: 24px;
+    }
+    QWidget#sidebar QLabel#templateLabel {
+        color: #6b7280; font-size: 11px; padding-top: 16px;
+    }
+    QPushButton#navButton {
+        text-align: left;
+        padding: 12px 16px;
+        border: none;
+        border-radius: 8px;
+        color: #9ca3af;
+        font-size: 14px;
+        background-color: transparent;
+    }
+    QPushButton#navButton:hover {
+        background-color: #1e1e2e;
+        color: #e8e8f0;
+    }
+    QPushButton#navButton:checked {
+        background-color: #8B5CF6;
+        color: white;
+    }
+    QPushButton#templateButton {
+        background-color: #1e1e2e;
+        color: #9ca3af;
+        padding: 8px 12px;
+        border: none;
+        border-radius: 6px;
+        font-size: 12px;
+    }
+    QPushButton#templateButton:hover {
+        background-color: #252542;
+        color: #e8e8f0;
+    }
+    QPushButton#exportButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+            stop:0 #8B5CF6, stop:1 #6366F1);
+        color: white;
+        padding: 16px;
+        border: none;
+        border-radius: 8px;
+        font-weight: 600;
+        font-size: 14px;
+    }
+    QPushButton#exportButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+            stop:0 #7C3AED, stop:1 #4F46E5);
+    }
+    QPushButton#exportButton:disabled {
+        background-color: #374151;
+        color: #6b7280;
+    }
+"""
+
 
 @dataclass
 class AudioTrack:
@@ -302,6 +663,7 @@ class ProjectConfig:
     image_transition_seconds: float = 3.0
     output_resolution: str = "1920x1080"
     fps: int = 30
+    video_encoder: str = ""  # VIDEO_ENCODERS key; resolved by the GUI before export
     
     # YouTube metadata
     youtube_title: str = ""
@@ -324,24 +686,149 @@ class ProjectConfig:
         """Load configuration from JSON file"""
         with open(filepath, 'r') as f:
             data = json.load(f)
-        return ProjectConfig(**data)
+        # Ignore settings that older versions saved but this one dropped
+        known = ProjectConfig.__dataclass_fields__
+        return ProjectConfig(**{key: value for key, value in data.items() if key in known})
+
+
+@dataclass(frozen=True)
+class FFmpegCapabilities:
+    """What the installed ffmpeg offers, from a single `ffmpeg -encoders` run"""
+    available: bool
+    encoders: frozenset = frozenset()
+
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_capabilities() -> FFmpegCapabilities:
+    """Probe ffmpeg once per process"""
+    try:
+        result = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return FFmpegCapabilities(available=False)
+    if result.returncode != 0:
+        return FFmpegCapabilities(available=False)
+    
+    # Encoder lines look like " V....D libx264   libx264 H.264 / AVC ..."
+    encoders = frozenset(
+        fields[1] for fields in (line.split() for line in result.stdout.splitlines())
+        if len(fields) >= 2 and len(fields[0]) == 6
+    )
+    return FFmpegCapabilities(available=True, encoders=encoders)
+
+
+def concat_list(files: List[str]) -> bytes:
+    """
+    ffmpeg concat demuxer list for `files`, to be fed through stdin.
+    Quotes are escaped, and file: URLs keep the entries from resolving
+    relative to pipe:.
+    """
+    lines = []
+    for path in files:
+        escaped = os.path.abspath(path).replace("'", "'\\''")
+        lines.append(f"file 'file:{escaped}'\n")
+    return "".join(lines).encode()
+
+
+def run_ffmpeg(cmd: List[str], duration: Optional[float] = None,
+               on_progress=None, input: Optional[bytes] = None):
+    """
+    Run an ffmpeg command, reporting real progress from `-progress pipe:1`.
+    on_progress(percent) is called as ffmpeg's output time advances through
+    `duration` seconds. `input` is fed to ffmpeg's stdin (pipe:0). Only the
+    last lines of stderr are kept; on failure they are raised as a
+    RuntimeError so the real ffmpeg message is shown.
+    """
+    cmd = [cmd[0], "-hide_banner", "-progress", "pipe:1", "-nostats"] + list(cmd[1:])
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, errors="replace")
+    
+    if input is not None:
+        def write_input():
+            try:
+                proc.stdin.buffer.write(input)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its stderr says why
+        threading.Thread(target=write_input, daemon=True).start()
+    
+    def read_progress():
+        last_percent = -1
+        for line in proc.stdout:
+            key, _, value = line.strip().partition("=")
+            # out_time_ms is in microseconds too, despite the name
+            if key in ("out_time_us", "out_time_ms") and duration and on_progress:
+                try:
+                    percent = min(100, int(int(value) / (duration * 1e4)))
+                except ValueError:
+                    continue
+                # Each progress block repeats the time; only report changes
+                if percent != last_percent:
+                    last_percent = percent
+                    on_progress(percent)
+    
+    reader = threading.Thread(target=read_progress, daemon=True)
+    reader.start()
+    tail = deque((line.rstrip() for line in proc.stderr), maxlen=FFMPEG_ERROR_TAIL_LINES)
+    proc.wait()
+    reader.join()
+    
+    if proc.returncode != 0:
+        raise RuntimeError("ffmpeg failed:\n" + "\n".join(tail))
 
 
 class FFmpegAnalyzer:
     """Analyze audio files using ffmpeg/ffprobe"""
     
+    # Persistent analysis cache keyed by "path:size:mtime_ns", shared by all instances
+    CACHE_MAX_ENTRIES = 1000
+    CACHE_SAVE_EVERY = 10
+    _cache: Optional[OrderedDict] = None
+    _cache_lock = threading.Lock()
+    _cache_dirty = 0
+    
     @staticmethod
     def check_ffmpeg() -> bool:
-        """Check if ffmpeg is installed"""
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except:
-            return False
+        """Check if ffmpeg is installed (checked once per process)"""
+        return ffmpeg_capabilities().available
+    
+    _hw_encoder: Optional[str] = None
+    
+    @classmethod
+    def detect_hw_encoder(cls) -> str:
+        """
+        Pick the first hardware H.264 encoder that actually works, falling
+        back to libx264. Builds often list encoders for hardware that isn't
+        present, so each candidate gets a tiny trial encode. Cached per process.
+        """
+        if cls._hw_encoder is not None:
+            return cls._hw_encoder
+        
+        # Only published once the trials are done, so a concurrent caller
+        # probes too rather than seeing a premature libx264
+        hw_encoder = "libx264"
+        encoders = ffmpeg_capabilities().encoders
+        
+        for name, profile in VIDEO_ENCODERS.items():
+            if name == "libx264" or name not in encoders:
+                continue
+            trial = ["ffmpeg", "-hide_banner", "-v", "error"] + profile.get("global", []) + [
+                "-f", "lavfi", "-i", "color=c=black:s=256x256:r=30:d=0.2"
+            ]
+            if profile.get("filter"):
+                trial += ["-vf", profile["filter"]]
+            trial += profile["args"] + ["-f", "null", "-"]
+            try:
+                if subprocess.run(trial, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                  timeout=15).returncode == 0:
+                    hw_encoder = name
+                    break
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+        
+        cls._hw_encoder = hw_encoder
+        return hw_encoder
     
     @staticmethod
     def get_install_instructions() -> str:
@@ -353,11 +840,150 @@ To install:
 Or download from: https://ffmpeg.org/download.html
 """
     
+    @classmethod
+    def _load_cache(cls) -> OrderedDict:
+        """Load the metadata cache from disk on first use (caller holds the lock)"""
+        if cls._cache is None:
+            cls._cache = OrderedDict()
+            try:
+                with open(METADATA_CACHE_PATH) as f:
+                    cls._cache.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+        return cls._cache
+    
+    @classmethod
+    def save_cache(cls):
+        """Write the metadata cache to disk if it changed"""
+        with cls._cache_lock:
+            if cls._cache is None or not cls._cache_dirty:
+                return
+            data = json.dumps(cls._cache)
+            cls._cache_dirty = 0
+        
+        tmp_path = METADATA_CACHE_PATH.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(data)
+            os.replace(tmp_path, METADATA_CACHE_PATH)
+        except OSError as e:
+            print(f"Could not save metadata cache: {e}")
+    
+    @staticmethod
+    def _cache_key(filepath: str) -> str:
+        st = os.stat(filepath)
+        return f"{os.path.abspath(filepath)}:{st.st_size}:{st.st_mtime_ns}"
+    
     def analyze(self, filepath: str) -> AudioTrack:
-        """Extract full metadata from audio file"""
-        filename = Path(filepath).name
+        """Extract full metadata from audio file, using the cache when unchanged"""
+        key = self._cache_key(filepath)
+        with self._cache_lock:
+            cache = self._load_cache()
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return AudioTrack(**{**cached, "path": filepath})
+        
+        track = self._analyze_uncached(filepath)
+        self._remember(key, track)
+        return track
+    
+    @classmethod
+    def _remember(cls, key: str, track: AudioTrack):
+        """Store an analysis result, evicting least recently used entries"""
+        with cls._cache_lock:
+            cache = cls._load_cache()
+            cache[key] = track.to_dict()
+            while len(cache) > cls.CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+            cls._cache_dirty += 1
+            should_save = cls._cache_dirty >= cls.CACHE_SAVE_EVERY
+        
+        if should_save:
+            cls.save_cache()
+    
+    @staticmethod
+    def _quick_wav_probe(filepath: str) -> Optional[tuple]:
+        """
+        Read (duration, sample_rate, channels) straight from a PCM WAV header.
+        Returns None for anything that isn't a plain RIFF/WAVE file so the
+        caller can fall back to ffprobe.
+        """
+        if not filepath.lower().endswith((".wav", ".wave")):
+            return None
         
-        # Get basic info with ffprobe
+        try:
+            with open(filepath, "rb") as f:
+                riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+                if riff != b"RIFF" or wave_id != b"WAVE":
+                    return None
+                
+                fmt = None
+                # Walk the chunks: fmt/data may be preceded by LIST, bext, etc.
+                while True:
+                    header = f.read(8)
+                    if len(header) < 8:
+                        return None
+                    chunk_id, chunk_size = struct.unpack("<4sI", header)
+                    if chunk_id == b"fmt ":
+                        fmt = struct.unpack("<HHIIHH", f.read(16))
+                        f.seek(chunk_size - 16 + (chunk_size & 1), os.SEEK_CUR)
+                    elif chunk_id == b"data":
+                        available = os.fstat(f.fileno()).st_size - f.tell()
+                        break
+                    else:
+                        f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+        except (OSError, struct.error):
+            return None
+        
+        if fmt is None:
+            return None
+        _, channels, sample_rate, byte_rate, _, _ = fmt
+        if not channels or not sample_rate or not byte_rate:
+            return None
+        
+        # A size of 0 or 0xFFFFFFFF means the writer never patched it (streamed WAV)
+        if chunk_size in (0, 0xFFFFFFFF):
+            return None
+        return min(chunk_size, available) / byte_rate, sample_rate, channels
+    
+    @staticmethod
+    def _layout_channels(layout: str) -> int:
+        """Channel count for an ffmpeg layout name (mono, stereo, 5.1(side), 3 channels...)"""
+        layout = layout.split("(")[0].strip()
+        named = {"mono": 1, "stereo": 2, "quad": 4, "hexagonal": 6, "octagonal": 8}
+        if layout in named:
+            return named[layout]
+        if layout.endswith(" channels"):
+            return int(layout.split()[0])
+        try:
+            return sum(int(part) for part in layout.split("."))
+        except ValueError:
+            return 2
+    
+    @classmethod
+    def _parse_input_header(cls, first_line: str, lines) -> tuple:
+        """
+        Read (duration, sample_rate, channels) from the "Input #0" block of
+        ffmpeg's log, consuming lines up to the first audio stream. duration
+        is None when ffmpeg can't tell it (e.g. "Duration: N/A").
+        """
+        duration = None
+        for line in itertools.chain([first_line], lines):
+            match = _DURATION_RE.search(line)
+            if match:
+                hours, minutes, seconds = match.groups()
+                duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+                continue
+            match = _AUDIO_STREAM_RE.search(line)
+            if match:
+                return duration, int(match.group(1)), cls._layout_channels(match.group(2))
+            if line.startswith(("Stream mapping", "Output #")):
+                break
+        return None, 48000, 2
+    
+    @staticmethod
+    def _ffprobe_info(filepath: str) -> tuple:
+        """(duration, sample_rate, channels) via ffprobe"""
         probe_cmd = [
             "ffprobe", "-v", "error",
             "-show_entries", "format=duration",
@@ -371,32 +997,57 @@ Or download from: https://ffmpeg.org/download.html
         
         duration = float(info.get('format', {}).get('duration', 0))
         stream = info.get('streams', [{}])[0]
-        sample_rate = int(stream.get('sample_rate', 48000))
-        channels = int(stream.get('channels', 2))
+        return duration, int(stream.get('sample_rate', 48000)), int(stream.get('channels', 2))
+    
+    def _analyze_uncached(self, filepath: str) -> AudioTrack:
+        """Run ffprobe + ebur128 on the file"""
+        filename = os.path.basename(filepath)
+        
+        # Get basic info from the WAV header; anything else is read from the
+        # input header ffmpeg prints during the loudness pass below
+        wav_info = self._quick_wav_probe(filepath)
+        header_info = None
+        
+        # Analyze loudness with ebur128 (audio stream only, skip video decoding).
+        # framelog=verbose keeps the per-frame meter lines out of the log so
+        # only the summary has to be parsed
+        loudness_filter = "ebur128=peak=true:framelog=verbose"
         
-        # Analyze loudness with ebur128
         loudness_cmd = [
-            "ffmpeg", "-i", filepath,
-            "-af", "ebur128=peak=true",
+            "ffmpeg", "-hide_banner", "-nostats", "-i", filepath,
+            "-map", "0:a", "-vn",
+            "-af", loudness_filter,
             "-f", "null", "-"
         ]
         
-        result = subprocess.run(loudness_cmd, capture_output=True, text=True)
-        output = result.stderr
-        
-        # Parse loudness
+        # Parse loudness line by line as ffmpeg reports it
         rms_loudness = -20.0
         peak_db = -1.0
         
-        for line in output.split('\n'):
+        proc = subprocess.Popen(loudness_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, bufsize=1)
+        for line in proc.stderr:
+            if header_info is None and not wav_info:
+                header_info = self._parse_input_header(line, proc.stderr)
+                continue
+            if 'I:' not in line and 'Peak:' not in line:
+                continue
             if 'I:' in line and 'LUFS' in line:
-                match = re.search(r'I:\s*([-\d.]+)\s*LUFS', line)
+                match = _I_RE.search(line)
                 if match:
                     rms_loudness = float(match.group(1))
             if 'Peak:' in line:
-                match = re.search(r'Peak:\s*([-\d.]+)', line)
+                match = _PEAK_RE.search(line)
                 if match:
                     peak_db = float(match.group(1))
+        proc.wait()
+        
+        if wav_info:
+            duration, sample_rate, channels = wav_info
+        elif header_info and header_info[0] is not None:
+            duration, sample_rate, channels = header_info
+        else:
+            duration, sample_rate, channels = self._ffprobe_info(filepath)
         
         # Determine energy profile
         if rms_loudness < -25:
@@ -427,6 +1078,36 @@ Or download from: https://ffmpeg.org/download.html
             channels=channels
         )
 
+    
+    def analyze_many(self, filepaths: List[str],
+                     on_progress: Optional[Callable[[int, int], None]] = None) -> List[AudioTrack]:
+        """
+        Analyze several files in parallel. Each worker just waits on
+        ffprobe/ffmpeg subprocesses, so threads scale with CPU cores.
+        Files that fail to analyze are skipped; input order is preserved.
+        on_progress(done, total) is called as each file finishes.
+        """
+        if not filepaths:
+            return []
+        
+        def safe_analyze(filepath: str) -> Optional[AudioTrack]:
+            try:
+                return self.analyze(filepath)
+            except Exception as e:
+                print(f"Error analyzing {filepath}: {e}")
+                return None
+        
+        max_workers = min(len(filepaths), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(safe_analyze, filepath) for filepath in filepaths]
+            if on_progress:
+                for done, _ in enumerate(as_completed(futures), 1):
+                    on_progress(done, len(futures))
+            results = [future.result() for future in futures]
+        
+        self.save_cache()
+        return [track for track in results if track is not None]
+
 
 class SequenceOptimizer:
     """Intelligently order tracks for optimal flow"""
@@ -445,77 +1126,117 @@ class SequenceOptimizer:
         energy_order = {"low": 0, "mid": 1, "high": 2, "unknown": 1}
         sorted_tracks = sorted(tracks, key=lambda t: energy_order.get(t.energy_profile, 1))
         
-        # Fine-tune: minimize loudness differences
-        optimized = [sorted_tracks[0]]
-        remaining = sorted_tracks[1:]
-        
-        while remaining:
-            current_loudness = optimized[-1].loudness_lufs
-            # Find closest loudness match
-            best_idx = min(
-                range(len(remaining)),
-                key=lambda i: abs(remaining[i].loudness_lufs - current_loudness)
-            )
-            optimized.append(remaining.pop(best_idx))
-        
+        # Fine-tune: minimize loudness differences (greedy nearest neighbour)
+        loudness = np.fromiter((t.loudness_lufs for t in sorted_tracks), dtype=np.float64,
+                               count=len(sorted_tracks))
+        alive = np.ones(len(sorted_tracks), dtype=bool)
+        alive[0] = False
+        order = [0]
+        current_loudness = loudness[0]
+        
+        for _ in range(len(sorted_tracks) - 1):
+            # Find closest loudness match among unused tracks
+            distance = np.where(alive, np.abs(loudness - current_loudness), np.inf)
+            best_idx = int(np.argmin(distance))
+            alive[best_idx] = False
+            order.append(best_idx)
+            current_loudness = loudness[best_idx]
+        
+        optimized = [sorted_tracks[i] for i in order]
         return optimized
 
 
 class BinauralGenerator:
     """Generate binaural beat audio tracks"""
     
-    def generate(self, duration: float, base_freq: float, beat_freq: float,
-                 output_path: str, sample_rate: int = 48000) -> str:
+    @staticmethod
+    def lavfi_inputs(base_freq: float, beat_freq: float, sample_rate: int = 48000) -> List[str]:
         """
-        Generate binaural beat:
+        ffmpeg input args for the two sine generators:
         - Left channel: base_freq
         - Right channel: base_freq + beat_freq
         """
-        left_freq = base_freq
-        right_freq = base_freq + beat_freq
-        
-        cmd = [
-            "ffmpeg", "-y",
+        return [
             "-f", "lavfi",
-            "-i", f"sine=frequency={left_freq}:sample_rate={sample_rate}",
+            "-i", f"sine=frequency={base_freq}:sample_rate={sample_rate}",
             "-f", "lavfi",
-            "-i", f"sine=frequency={right_freq}:sample_rate={sample_rate}",
-            "-filter_complex", "[0:a][1:a]join=inputs=2:channel_layout=stereo[a]",
-            "-map", "[a]",
-            "-t", str(duration),
-            "-c:a", "pcm_s24le",
-            output_path
+            "-i", f"sine=frequency={base_freq + beat_freq}:sample_rate={sample_rate}",
         ]
-        
-        subprocess.run(cmd, check=True, capture_output=True)
-        return output_path
 
 
-class AudioProcessor(QThread):
-    """Background thread for audio processing with detailed progress"""
+class QueueSignal:
+    """Signal-like emitter for the worker process; events are queued for the GUI"""
     
-    # Progress signals: message, percentage, step number, total steps
-    progress = pyqtSignal(str, int, int, int)
-    stage_started = pyqtSignal(str, str)  # stage name, description
-    stage_completed = pyqtSignal(str, str)  # stage name, result
-    finished = pyqtSignal(dict)
-    error = pyqtSignal(str)
+    def __init__(self, name: str, events):
+        self.name = name
+        self.events = events
     
-    def __init__(self, tracks: List[AudioTrack], images: List[str], config: ProjectConfig):
-        super().__init__()
+    def emit(self, *args):
+        self.events.put((self.name, args))
+
+
+class ExportPipeline:
+    """Audio/video export pipeline with detailed progress, run in a worker process"""
+    
+    def __init__(self, tracks: List[AudioTrack], images: List[str], config: ProjectConfig, events):
         self.tracks = tracks
         self.images = images
         self.config = config
-        self.temp_files = []
+        self.temp_files = set()
         self.current_stage = 0
         self.total_stages = 6
+        self.events = events
+        self.stage_started = QueueSignal("stage_started", events)  # stage name, description
+        self.stage_completed = QueueSignal("stage_completed", events)  # stage name, result
+        self.finished = QueueSignal("finished", events)
+        self.error = QueueSignal("error", events)
+        self._clip_paths = {}
+        self._prepare_ffmpeg_args()
+    
+    def _prepare_ffmpeg_args(self):
+        """Build the config-derived ffmpeg args and filters once per export"""
+        cfg = self.config
+        width, height = cfg.output_resolution.split("x")
+        
+        self._lavfi_color = f"color=c=black:s={cfg.output_resolution}:r={cfg.fps}"
+        self._intro_filter = None
+        if cfg.intro_text:
+            text = cfg.intro_text.replace("'", "\\'")  # Escape text for drawtext
+            self._intro_filter = (
+                f"drawtext=text='{text}':fontcolor=white:fontsize=48:x=(w-text_w)/2:y=(h-text_h)/2"
+            )
+        self._still_filter = (
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black"
+        )
         
+        # Only one ffmpeg runs at a time, so each may use every core
+        self._ffmpeg_threads = str(CPU_COUNT)
+        
+        # Video encoder settings
+        self._clip_codec_args = []
+        self._video_global_args = []
+        self._video_hw_filter = None
+        if cfg.video_mode != "audio_only":
+            # The worker is a fresh process with empty caches, so the GUI
+            # resolves the encoder; only probe here if it didn't
+            encoder = cfg.video_encoder
+            if encoder not in VIDEO_ENCODERS:
+                encoder = FFmpegAnalyzer.detect_hw_encoder()
+            profile = VIDEO_ENCODERS[encoder]
+            # Constant frames: B-frames and lookahead are pure cost, short GOP
+            self._clip_codec_args = profile["args"] + profile.get("clip", []) + [
+                "-bf", "0", "-g", str(int(cfg.fps * 2)), "-threads", self._ffmpeg_threads
+            ]
+            self._video_global_args = profile.get("global", [])
+            self._video_hw_filter = profile.get("filter")
+    
     def emit_progress(self, message: str, percent_in_stage: int = 0):
-        """Calculate overall percentage and emit"""
+        """Calculate overall percentage and send it to the GUI"""
         stage_percent = 100 / self.total_stages
         overall_percent = int((self.current_stage * stage_percent) + 
                              (percent_in_stage * stage_percent / 100))
-        self.progress.emit(message, overall_percent, self.current_stage + 1, self.total_stages)
+        self.events.put(("progress", (message, overall_percent, self.current_stage + 1, self.total_stages)))
         
     def run(self):
         try:
@@ -530,64 +1251,53 @@ class AudioProcessor(QThread):
         """Main processing pipeline with detailed status updates"""
         results = {}
         
-        # Stage 1: Build sequenced audio with crossfades
+        # Stage 1: Plan the crossfaded sequence
         self.current_stage = 0
         self.stage_started.emit("sequencing", f"Analyzing {len(self.tracks)} tracks and building crossfaded sequence")
         self.emit_progress("Reading track metadata...", 10)
         
-        sequenced_path = self._build_sequenced_audio()
-        results["sequenced_audio"] = sequenced_path
+        crossfade = self._safe_crossfade()
+        if len(self.tracks) > 1:
+            self.emit_progress(f"Using {crossfade:.1f}s crossfade (limited by track lengths)", 50)
         
-        self.emit_progress("Crossfade sequence complete", 100)
-        self.stage_completed.emit("sequencing", f"Created seamless sequence from {len(self.tracks)} tracks")
+        self.emit_progress("Crossfade sequence planned", 100)
+        self.stage_completed.emit("sequencing", f"Planned seamless sequence from {len(self.tracks)} tracks")
         
-        # Stage 2: Generate binaural beats
+        # Stage 2: Binaural beats are generated inside the master render
         self.current_stage = 1
         preset_name = BINAURAL_PRESETS.get(self.config.binaural_preset, {}).get("name", "Custom")
-        self.stage_started.emit("binaural", f"Generating {preset_name} binaural beat layer")
-        self.emit_progress("Creating sine wave generators...", 20)
+        self.stage_started.emit("binaural", f"Preparing {preset_name} binaural beat layer")
         
-        binaural_path = self._generate_binaural(sequenced_path)
-        results["binaural_audio"] = binaural_path
+        base, beat = self._binaural_frequencies()
         
-        self.emit_progress("Binaural track generated", 100)
-        freq_info = f"{self.config.binaural_base_freq}Hz base + {self.config.binaural_beat_freq}Hz beat"
-        self.stage_completed.emit("binaural", f"Generated {freq_info} binaural layer")
+        self.emit_progress("Binaural generators configured", 100)
+        self.stage_completed.emit("binaural", f"Configured {base}Hz base + {beat}Hz beat binaural layer")
         
-        # Stage 3: Mix audio layers
+        # Stage 3: Mixing is part of the same filter graph
         self.current_stage = 2
         self.stage_started.emit("mixing", f"Blending music with binaural beats at {self.config.binaural_volume_db}dB")
-        self.emit_progress("Aligning audio streams...", 30)
-        
-        final_audio = self._mix_audio(sequenced_path, binaural_path)
-        results["final_audio"] = final_audio
-        
-        self.emit_progress("Audio layers mixed", 100)
-        self.stage_completed.emit("mixing", "Music and binaural beats blended successfully")
+        self.emit_progress("Mix graph ready", 100)
+        self.stage_completed.emit("mixing", "Music and binaural mix planned")
         
-        # Stage 4: Normalize and export audio
+        # Stage 4: Render sequence + binaural + mix + loudness (+ loop, + video) in one ffmpeg pass
         self.current_stage = 3
-        self.stage_started.emit("exporting", f"Normalizing to {self.config.target_loudness_lufs} LUFS")
-        self.emit_progress("Applying loudness normalization...", 50)
+        self.stage_started.emit("exporting", f"Rendering master normalized to {self.config.target_loudness_lufs} LUFS")
         
-        # Handle looping if enabled
-        if self.config.loop_mode and self.config.target_duration_minutes > 0:
-            current_duration = self._get_audio_duration(final_audio)
-            target_duration = self.config.target_duration_minutes * 60
-            
-            if current_duration < target_duration:
-                self.emit_progress(f"Looping audio from {current_duration/60:.1f}min to {self.config.target_duration_minutes:.1f}min...", 55)
-                final_audio = self._loop_audio(final_audio, target_duration)
+        # The video is written by the master render itself, so the clips it
+        # is stream-copied from have to exist first
+        if self._uses_clips():
+            self.emit_progress("Preparing video clips...", 0)
+            self._ensure_clips()
         
-        audio_export = self._export_audio(final_audio)
+        self.emit_progress("Rendering master track...", 0)
+        audio_export, video_export, duration = self._build_master(with_video=self._uses_clips())
         results["audio_path"] = audio_export
         
         self.emit_progress("Audio export complete", 100)
         file_size = Path(audio_export).stat().st_size / (1024*1024)
-        self.stage_completed.emit("exporting", f"Master audio exported ({file_size:.1f} MB)")
+        self.stage_completed.emit("exporting", f"Master audio exported ({file_size:.1f} MB, {duration/60:.1f} min)")
         
-        # Stage 5: Create video if requested
-        video_export = None
+        # Stage 5: Video, already rendered alongside the master
         if self.config.video_mode != "audio_only":
             self.current_stage = 4
             mode_desc = {
@@ -597,9 +1307,6 @@ class AudioProcessor(QThread):
             }.get(self.config.video_mode, "Video")
             
             self.stage_started.emit("video", f"Creating {mode_desc} video at {self.config.output_resolution}")
-            self.emit_progress("Generating video frames...", 40)
-            
-            video_export = self._create_video(final_audio)
             results["video_path"] = video_export
             
             self.emit_progress("Video encoding complete", 100)
@@ -628,328 +1335,429 @@ class AudioProcessor(QThread):
         
         self.finished.emit(results)
     
-    def _build_sequenced_audio(self) -> str:
-        """Crossfade tracks together with safe duration calculations"""
-        if len(self.tracks) == 1:
-            # Single track: just normalize
-            output = str(TEMP_DIR / "sequenced.wav")
-            self._normalize_track(self.tracks[0].path, output)
-            self.temp_files.append(output)
-            return output
-        
-        # Calculate safe crossfade duration based on shortest track
+    def _safe_crossfade(self) -> float:
+        """Crossfade duration limited by the shortest track"""
         min_duration = min(t.duration for t in self.tracks)
         # Crossfade can't be more than half the shortest track (need overlap)
-        safe_crossfade = min(self.config.crossfade_seconds, min_duration / 2, 4.0)
+        return min(self.config.crossfade_seconds, min_duration / 2, 4.0)
+    
+    def _binaural_frequencies(self) -> tuple:
+        """Resolve (base, beat) frequencies from the preset or custom settings"""
+        if self.config.binaural_preset == "custom":
+            return self.config.binaural_base_freq, self.config.binaural_beat_freq
+        preset = BINAURAL_PRESETS.get(self.config.binaural_preset, BINAURAL_PRESETS["delta_deep_sleep"])
+        return preset["base"], preset["beat"]
+    
+    def _sequence_filter(self) -> tuple:
+        """
+        Build the crossfade part of the filter graph.
+        Returns (filter_parts, output_label, sequence_duration).
+        """
+        n = len(self.tracks)
+        fade_in = self.config.fade_in_seconds
+        fade_out = self.config.fade_out_seconds
+        # Resample every input to the master format so acrossfade/amix never renegotiate
+        fmt = f"aformat=sample_rates={MASTER_SAMPLE_RATE}:channel_layouts=stereo"
+        fade_in_filter = f"afade=t=in:ss=0:d={fade_in}"
+        last_duration = self.tracks[-1].duration
+        fade_out_filter = f"afade=t=out:st={max(0, last_duration - fade_out)}:d={fade_out}"
+        
+        if n == 1:
+            filter_parts = [f"[0:a]{fmt},{fade_in_filter},{fade_out_filter}[a0]"]
+            return filter_parts, "a0", last_duration
+        
+        safe_crossfade = self._safe_crossfade()
+        crossfade = f"acrossfade=d={safe_crossfade}:c1=tri:c2=tri"
+        
+        # Prepare each track: fade in the first, fade out the last
+        filter_parts = [f"[0:a]{fmt},{fade_in_filter}[a0]"]
+        filter_parts.extend(f"[{i}:a]{fmt}[a{i}]" for i in range(1, n - 1))
+        filter_parts.append(f"[{n-1}:a]{fmt},{fade_out_filter}[a{n-1}]")
+        
+        # Crossfade chain with safe duration
+        prev = "a0"
+        for i in range(n - 1):
+            filter_parts.append(f"[{prev}][a{i+1}]{crossfade}[cf{i}]")
+            prev = f"cf{i}"
         
-        self.emit_progress(f"Using {safe_crossfade:.1f}s crossfade (limited by track lengths)", 20)
+        duration = sum(t.duration for t in self.tracks) - (n - 1) * safe_crossfade
+        return filter_parts, prev, duration
+    
+    def _build_master(self, with_video: bool = False) -> tuple:
+        """
+        Render the master track with a single ffmpeg invocation:
+        crossfaded sequence + binaural layer -> amix -> loudnorm -> optional aloop.
+        With with_video the same process also writes the MP4, so the mixed
+        audio goes straight to the AAC encoder instead of being read back
+        from the master WAV. Returns (output_path, video_path, duration_seconds).
+        """
+        n = len(self.tracks)
         
-        # Build filter complex for multiple tracks
         inputs = []
         for track in self.tracks:
             inputs.extend(["-i", track.path])
         
-        # Create crossfade filter
-        filter_parts = []
-        n = len(self.tracks)
+        base, beat = self._binaural_frequencies()
+        inputs.extend(BinauralGenerator.lavfi_inputs(base, beat, MASTER_SAMPLE_RATE))
         
-        # Prepare each track
-        for i in range(n):
-            if i == 0:
-                # First track: fade in
-                filter_parts.append(
-                    f"[{i}:a]afade=t=in:ss=0:d={self.config.fade_in_seconds}[a{i}]"
-                )
-            elif i == n - 1:
-                # Last track: fade out
-                duration = self.tracks[i].duration
-                fade_start = max(0, duration - self.config.fade_out_seconds)
-                filter_parts.append(
-                    f"[{i}:a]afade=t=out:st={fade_start}:d={self.config.fade_out_seconds}[a{i}]"
-                )
-            else:
-                filter_parts.append(f"[{i}:a]anull[a{i}]")
+        filter_parts, seq_label, duration = self._sequence_filter()
+        filter_parts.append(
+            f"[{n}:a][{n+1}:a]join=inputs=2:channel_layout=stereo,"
+            f"volume={self.config.binaural_volume_db}dB[bin]"
+        )
+        # The sine sources are infinite, so the music decides when the mix ends
+        filter_parts.append(f"[{seq_label}][bin]amix=inputs=2:duration=first:dropout_transition=3[mix]")
+        # loudnorm upsamples internally; bring it back to the master rate
+        filter_parts.append(
+            f"[mix]loudnorm=I={self.config.target_loudness_lufs}:TP=-1.5,"
+            f"aresample={MASTER_SAMPLE_RATE}[norm]"
+        )
         
-        # Crossfade chain with safe duration
-        for i in range(n - 1):
-            if i == 0:
+        out_label = "norm"
+        video_index = n + 2  # after the tracks and the two sine sources
+        target_duration = self.config.target_duration_minutes * 60
+        if self.config.loop_mode and target_duration > duration:
+            self.emit_progress(f"Looping audio from {duration/60:.1f}min to {self.config.target_duration_minutes:.1f}min...", 20)
+            if duration <= ALOOP_MAX_SECONDS:
+                # aloop buffers the whole sequence; store it as s32 rather than
+                # loudnorm's doubles to halve that memory (output is 24-bit anyway)
+                loop_size = math.ceil(duration * MASTER_SAMPLE_RATE)
                 filter_parts.append(
-                    f"[a{i}][a{i+1}]acrossfade=d={safe_crossfade}:c1=tri:c2=tri[cf{i}]"
+                    f"[norm]aformat=sample_fmts=s32,aloop=loop=-1:size={loop_size},"
+                    f"atrim=duration={target_duration}[looped]"
                 )
             else:
-                filter_parts.append(
-                    f"[cf{i-1}][a{i+1}]acrossfade=d={safe_crossfade}:c1=tri:c2=tri[cf{i}]"
-                )
-        
-        final_label = f"cf{n-2}" if n > 1 else "a0"
-        filter_complex = ";".join(filter_parts)
-        filter_complex += f";[{final_label}]aloudnorm=I={self.config.target_loudness_lufs}:TP=-1.5[outa]"
-        
-        output = str(TEMP_DIR / "sequenced.wav")
-        cmd = ["ffmpeg", "-y"] + inputs + [
-            "-filter_complex", filter_complex,
-            "-map", "[outa]",
-            "-c:a", "pcm_s24le",
-            output
-        ]
-        
-        subprocess.run(cmd, check=True, capture_output=True)
-        self.temp_files.append(output)
-        return output
-    
-    def _normalize_track(self, input_path: str, output_path: str):
-        """Normalize a single track"""
-        cmd = [
-            "ffmpeg", "-y", "-i", input_path,
-            "-af", f"afade=t=in:ss=0:d={self.config.fade_in_seconds},"
-                   f"afade=t=out:st=0:d={self.config.fade_out_seconds},"
-                   f"aloudnorm=I={self.config.target_loudness_lufs}:TP=-1.5",
-            "-c:a", "pcm_s24le",
-            output_path
-        ]
-        subprocess.run(cmd, check=True, capture_output=True)
-    
-    def _generate_binaural(self, music_path: str) -> str:
-        """Generate binaural beat track matching music duration"""
-        # Get duration
-        probe_cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            music_path
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
-        
-        # Generate binaural
-        output = str(TEMP_DIR / "binaural.wav")
-        
-        preset = BINAURAL_PRESETS.get(self.config.binaural_preset, BINAURAL_PRESETS["delta_deep_sleep"])
-        if self.config.binaural_preset == "custom":
-            base = self.config.binaural_base_freq
-            beat = self.config.binaural_beat_freq
-        else:
-            base = preset["base"]
-            beat = preset["beat"]
-        
-        gen = BinauralGenerator()
-        gen.generate(duration, base, beat, output)
+                # Too long to hold in memory: render the sequence once to a
+                # level-0 FLAC temp and loop it from disk
+                sequence = self._render_sequence(inputs, filter_parts, duration)
+                inputs = ["-stream_loop", "-1", "-i", sequence]
+                filter_parts = [f"[0:a]atrim=duration={target_duration}[looped]"]
+                video_index = 1
+            out_label = "looped"
+            duration = target_duration
+        
+        video_output = None
+        video_partial = None
+        video_args = []
+        cmd_input = None
+        if with_video:
+            video_inputs, cmd_input = self._video_input(duration)
+            inputs.extend(video_inputs)
+            filter_parts.append(f"[{out_label}]asplit=2[master][video_audio]")
+            out_label = "master"
+            
+            video_output = self._export_path(".mp4")
+            video_partial = self._partial_path(video_output)
+            video_args = [
+                "-map", f"{video_index}:v", "-map", "[video_audio]",
+                "-c:v", "copy", "-c:a", "aac", "-b:a", "192k",
+                "-t", str(duration),
+                video_partial
+            ]
         
-        self.temp_files.append(output)
-        return output
-    
-    def _mix_audio(self, music_path: str, binaural_path: str) -> str:
-        """Mix binaural under music"""
-        output = str(TEMP_DIR / "mixed.wav")
-        
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", music_path,
-            "-i", binaural_path,
-            "-filter_complex",
-            f"[1:a]volume={self.config.binaural_volume_db}dB[bin];"
-            f"[0:a][bin]amix=inputs=2:duration=longest:dropout_transition=3[outa]",
-            "-map", "[outa]",
+        output = self._export_path("_master.wav")
+        partial = self._partial_path(output)
+        cmd = ["ffmpeg", "-y", "-filter_complex_threads", self._ffmpeg_threads] + inputs + [
+            "-filter_complex", ";".join(filter_parts),
+            "-map", f"[{out_label}]",
             "-c:a", "pcm_s24le",
+            partial
+        ] + video_args
+        
+        label = "Rendering master track and video" if with_video else "Rendering master track"
+        run_ffmpeg(cmd, duration,
+                   lambda pct: self.emit_progress(f"{label}... {pct}%", pct),
+                   input=cmd_input)
+        self._publish(partial, output)
+        if video_output:
+            self._publish(video_partial, video_output)
+        return output, video_output, duration
+    
+    def _render_sequence(self, inputs: List[str], filter_parts: List[str], duration: float) -> str:
+        """
+        Render the normalized mix (the graph's [norm] output) to a lossless
+        temp file that the master render loops with -stream_loop
+        """
+        output = str(TEMP_DIR / f"{os.getpid()}_sequence.flac")
+        self.temp_files.add(output)
+        cmd = ["ffmpeg", "-y", "-filter_complex_threads", self._ffmpeg_threads] + inputs + [
+            "-filter_complex", ";".join(filter_parts),
+            "-map", "[norm]",
+            "-c:a", "flac", "-compression_level", "0", "-sample_fmt", "s32",
             output
         ]
-        
-        subprocess.run(cmd, check=True, capture_output=True)
-        self.temp_files.append(output)
+        run_ffmpeg(cmd, duration,
+                   lambda pct: self.emit_progress(f"Rendering sequence... {pct}%", pct))
         return output
     
-    def _export_audio(self, audio_path: str) -> str:
-        """Export final audio to Desktop"""
-        safe_name = "".join(c for c in self.config.project_name if c.isalnum() or c in "-_ ").strip()
+    def _export_path(self, suffix: str) -> str:
+        """Build an export path in EXPORTS_DIR from the project name"""
+        safe_name = _UNSAFE_NAME_RE.sub("", self.config.project_name).strip()
         if not safe_name:
             safe_name = "flowstate_export"
-        
-        output = str(EXPORTS_DIR / f"{safe_name}_master.wav")
-        
-        # Copy the final mix
-        shutil.copy2(audio_path, output)
-        return output
+        return str(EXPORTS_DIR / f"{safe_name}{suffix}")
     
-    def _get_audio_duration(self, audio_path: str) -> float:
-        """Get duration of audio file in seconds"""
-        probe_cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            audio_path
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        return float(result.stdout.strip())
-    
-    def _loop_audio(self, audio_path: str, target_duration: float) -> str:
-        """Loop audio to reach target duration with seamless transitions"""
-        output = str(TEMP_DIR / "looped.wav")
-        
-        # Use ffmpeg's loop filter with acrossfade for seamless looping
-        cmd = [
-            "ffmpeg", "-y",
-            "-stream_loop", "-1",  # Loop indefinitely
-            "-i", audio_path,
-            "-t", str(target_duration),
-            "-af", "afade=t=in:ss=0:d=0.5,afade=t=out:st=0:d=0.5",
-            "-c:a", "pcm_s24le",
-            output
-        ]
-        
-        subprocess.run(cmd, check=True, capture_output=True)
-        self.temp_files.append(output)
-        return output
+    def _partial_path(self, output: str) -> str:
+        """
+        In-progress name for an export, next to the final file so that
+        publishing it is a same-filesystem rename, never a copy
+        """
+        partial = self._partial_name(output)
+        self.temp_files.add(partial)
+        return partial
     
-    def _create_video(self, audio_path: str) -> Optional[str]:
-        """Create video with the audio"""
-        safe_name = "".join(c for c in self.config.project_name if c.isalnum() or c in "-_ ").strip()
-        if not safe_name:
-            safe_name = "flowstate_export"
-        
-        output = str(EXPORTS_DIR / f"{safe_name}.mp4")
-        
-        # Get audio duration
-        probe_cmd = [
-            "ffprobe", "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            audio_path
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
-        
-        # Create video based on mode
-        if self.config.video_mode == "black_screen":
-            video = self._create_black_video(duration)
-        elif self.config.video_mode == "images" and self.images:
-            video = self._create_image_video(duration)
-        elif self.config.video_mode == "hybrid":
-            video = self._create_hybrid_video(duration)
+    @staticmethod
+    def _partial_name(output: str) -> str:
+        root, ext = os.path.splitext(output)
+        return f"{root}.partial{ext}"
+    
+    def _publish(self, partial: str, output: str):
+        """Atomically move a finished render to its final export name"""
+        os.replace(partial, output)
+        self.temp_files.discard(partial)
+    
+    def _video_input(self, duration: float) -> tuple:
+        """Video input args for the master render, and their stdin data, by mode"""
+        if self.config.video_mode == "images" and self.images:
+            return self._image_video_input()
+        if self.config.video_mode == "hybrid":
+            return self._hybrid_video_input(duration)
+        # Black screen (also the fallback)
+        return self._black_video_input(duration)
+    
+    def _uses_clips(self) -> bool:
+        """True if the video is stream-copied from short pre-encoded clips"""
+        return self.config.video_mode != "audio_only"
+    
+    def _ensure_clips(self):
+        """
+        Make sure the clips the final video is stream-copied from exist in
+        the clip cache, encoding only the ones a previous export didn't
+        """
+        if self.config.video_mode == "images" and self.images:
+            clips = {"image": self._image_clip()}
         else:
-            # Fallback to black screen
-            video = self._create_black_video(duration)
-        
-        self.temp_files.append(video)
-        
-        # Combine video + audio
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", video,
-            "-i", audio_path,
-            "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-            "-c:a", "aac", "-b:a", "192k",
-            "-shortest",
-            output
+            clips = self._black_clips()
+        self._clip_paths = {name: clip[0] for name, clip in clips.items()}
+        
+        pending = []
+        for clip in clips.values():
+            if os.path.exists(clip[0]):
+                os.utime(clip[0])  # Mark as recently used
+            else:
+                pending.append(clip)
+        
+        if pending:
+            self._encode_clips(pending)
+            self._prune_clip_cache()
+    
+    def _black_clips(self) -> Dict[str, tuple]:
+        """The black clip and the intro clip (if any)"""
+        input_args = self._color_input(CLIP_SECONDS)
+        clips = {"black": (self._clip_cache_path("black", input_args, None), input_args, None)}
+        
+        if self._intro_filter:
+            input_args = self._color_input(self.config.intro_duration_seconds)
+            clips["intro"] = (
+                self._clip_cache_path("intro", input_args, self._intro_filter),
+                input_args, self._intro_filter
+            )
+        return clips
+    
+    def _image_clip(self) -> tuple:
+        """A clip of the still image, scaled and padded to the output size"""
+        # Simplified: use first image for entire duration
+        # Full slideshow implementation would go here
+        input_args = [
+            "-loop", "1", "-framerate", str(self.config.fps),
+            "-t", str(CLIP_SECONDS), "-i", self.images[0],
         ]
+        with open(self.images[0], 'rb') as f:
+            content = f.read()
+        return (self._clip_cache_path("image", input_args, self._still_filter, content),
+                input_args, self._still_filter)
+    
+    def _clip_cache_path(self, name: str, input_args: List[str], video_filter: Optional[str],
+                         content: bytes = b"") -> str:
+        """Clip path keyed by everything that determines the encoded bytes"""
+        digest = hashlib.sha256(json.dumps([
+            input_args, video_filter, self._video_hw_filter,
+            self._video_global_args, self._clip_codec_args,
+        ]).encode())
+        digest.update(content)
+        return str(CLIP_CACHE_DIR / f"{name}_{digest.hexdigest()[:16]}.mp4")
+    
+    def _prune_clip_cache(self):
+        """Evict least recently used clips until the cache fits CLIP_CACHE_MAX_BYTES"""
+        in_use = set(self._clip_paths.values())
+        entries = sorted(os.scandir(CLIP_CACHE_DIR), key=lambda e: e.stat().st_mtime, reverse=True)
+        total = 0
+        for entry in entries:
+            total += entry.stat().st_size
+            if total > CLIP_CACHE_MAX_BYTES and entry.path not in in_use:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    
+    def _color_input(self, seconds: float) -> List[str]:
+        """lavfi input args for black frames of the given length"""
+        return ["-f", "lavfi", "-i", f"{self._lavfi_color}:d={seconds}"]
+    
+    def _encode_clips(self, clips: List[tuple]):
+        """
+        Encode short clips, each (output, input_args, video_filter), with the
+        export's video codec. All clips come out of a single ffmpeg process:
+        one input and one output per clip, encoded side by side. Outputs are
+        only published once the whole encode succeeded.
+        """
+        cmd = ["ffmpeg", "-y", "-filter_threads", self._ffmpeg_threads] + self._video_global_args
+        for _, input_args, _ in clips:
+            cmd += input_args
         
-        subprocess.run(cmd, check=True, capture_output=True)
-        return output
-    
-    def _create_black_video(self, duration: float) -> str:
-        """Create black screen video with optional intro text"""
-        output = str(TEMP_DIR / "video_black.mp4")
+        for index, (output, _, video_filter) in enumerate(clips):
+            if self._video_hw_filter:
+                video_filter = f"{video_filter},{self._video_hw_filter}" if video_filter else self._video_hw_filter
+            cmd += ["-map", f"{index}:v"]
+            if video_filter:
+                cmd += ["-vf", video_filter]
+            cmd += self._clip_codec_args + ["-an", self._partial_path(output)]
         
-        if self.config.intro_text:
-            # Create intro + black
-            intro_path = str(TEMP_DIR / "intro_part.mp4")
-            black_path = str(TEMP_DIR / "black_part.mp4")
-            concat_list = str(TEMP_DIR / "concat.txt")
-            
-            # Escape text for drawtext
-            text = self.config.intro_text.replace("'", "\\'")
-            
-            # Intro with text
-            cmd1 = [
-                "ffmpeg", "-y",
-                "-f", "lavfi",
-                "-i", f"color=c=black:s={self.config.output_resolution}:r={self.config.fps}",
-                "-vf", f"drawtext=text='{text}':fontcolor=white:fontsize=48:x=(w-text_w)/2:y=(h-text_h)/2",
-                "-t", str(self.config.intro_duration_seconds),
-                "-c:v", "libx264", "-preset", "ultrafast",
-                "-an", intro_path
-            ]
-            subprocess.run(cmd1, check=True, capture_output=True)
-            self.temp_files.append(intro_path)
-            
-            # Black remainder
-            remainder = duration - self.config.intro_duration_seconds
-            if remainder > 0:
-                cmd2 = [
-                    "ffmpeg", "-y",
-                    "-f", "lavfi",
-                    "-i", f"color=c=black:s={self.config.output_resolution}:r={self.config.fps}",
-                    "-t", str(remainder),
-                    "-c:v", "libx264", "-preset", "ultrafast",
-                    "-an", black_path
-                ]
-                subprocess.run(cmd2, check=True, capture_output=True)
-                self.temp_files.append(black_path)
-                
-                # Concatenate
-                with open(concat_list, 'w') as f:
-                    f.write(f"file '{intro_path}'\n")
-                    f.write(f"file '{black_path}'\n")
-                self.temp_files.append(concat_list)
-                
-                cmd3 = [
-                    "ffmpeg", "-y",
-                    "-f", "concat", "-safe", "0",
-                    "-i", concat_list,
-                    "-c", "copy",
-                    output
-                ]
-                subprocess.run(cmd3, check=True, capture_output=True)
-            else:
-                shutil.move(intro_path, output)
-        else:
-            # Pure black
-            cmd = [
-                "ffmpeg", "-y",
-                "-f", "lavfi",
-                "-i", f"color=c=black:s={self.config.output_resolution}:r={self.config.fps}",
-                "-t", str(duration),
-                "-c:v", "libx264", "-preset", "ultrafast",
-                "-an", output
-            ]
-            subprocess.run(cmd, check=True, capture_output=True)
+        run_ffmpeg(cmd)
         
-        return output
+        for output, _, _ in clips:
+            self._publish(self._partial_name(output), output)
     
-    def _create_image_video(self, duration: float) -> str:
-        """Create slideshow from images"""
-        output = str(TEMP_DIR / "video_images.mp4")
+    def _black_video_input(self, duration: float) -> tuple:
+        """
+        Black screen video with optional intro text. Every black frame is
+        identical, so only a short clip is encoded; the full length is
+        stream-copied from it. Returns the input args and their stdin data.
+        """
+        black_path = self._clip_paths["black"]
+        intro_path = self._clip_paths.get("intro")
         
-        if not self.images:
-            return self._create_black_video(duration)
+        if not self.config.intro_text:
+            # Pure black: loop the clip
+            return ["-stream_loop", "-1", "-i", black_path], None
         
-        # Simplified: use first image for entire duration
-        # Full slideshow implementation would go here
-        cmd = [
-            "ffmpeg", "-y",
-            "-loop", "1", "-i", self.images[0],
-            "-t", str(duration),
-            "-vf", f"scale={self.config.output_resolution}:force_original_aspect_ratio=decrease,pad={self.config.output_resolution}:(ow-iw)/2:(oh-ih)/2:black",
-            "-c:v", "libx264", "-preset", "medium",
-            "-an", output
-        ]
-        subprocess.run(cmd, check=True, capture_output=True)
+        remainder = duration - self.config.intro_duration_seconds
+        if remainder <= 0:
+            # Intro covers the whole audio
+            return ["-i", intro_path], None
         
-        return output
+        # Intro with text, then the black clip repeated for the remainder;
+        # the list goes through stdin
+        clips = [intro_path] + [black_path] * math.ceil(remainder / CLIP_SECONDS)
+        
+        return ["-f", "concat", "-safe", "0", "-protocol_whitelist", "file,pipe",
+                "-i", "pipe:0"], concat_list(clips)
+    
+    def _image_video_input(self) -> tuple:
+        """
+        Still-image video. Like the black screen, a short clip of the image
+        is encoded once and looped by stream copy. Returns the input args
+        and their stdin data.
+        """
+        image_path = self._clip_paths["image"]
+        return ["-stream_loop", "-1", "-i", image_path], None
     
-    def _create_hybrid_video(self, duration: float) -> str:
+    def _hybrid_video_input(self, duration: float) -> tuple:
         """Intro -> Black -> Images -> Black"""
         # Simplified hybrid implementation
         # Would create segments and concatenate
-        return self._create_black_video(duration)
+        return self._black_video_input(duration)
     
     def cleanup(self):
         """Remove temporary files"""
         for f in self.temp_files:
             try:
-                if os.path.exists(f):
-                    os.remove(f)
-            except:
+                os.unlink(f)
+            except FileNotFoundError:
                 pass
+        self.temp_files.clear()
+
+
+def run_pipeline(tracks: List[AudioTrack], images: List[str], config: ProjectConfig, events):
+    """Worker process entry point"""
+    ExportPipeline(tracks, images, config, events).run()
+
+
+class AudioProcessor(QObject):
+    """
+    Runs the export pipeline in a separate process so CPU-bound Python work
+    never competes with the GUI for the GIL. Worker events arrive over a
+    queue that is drained on a timer and re-emitted as Qt signals.
+    """
+    
+    # Progress is not a signal: the GUI polls take_progress() on a timer so
+    # frequent updates can't flood the event loop
+    stage_started = pyqtSignal(str, str)  # stage name, description
+    stage_completed = pyqtSignal(str, str)  # stage name, result
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, tracks: List[AudioTrack], images: List[str], config: ProjectConfig, parent=None):
+        super().__init__(parent)
+        self.tracks = tracks
+        self.images = images
+        self.config = config
+        # spawn: never fork a process that has Qt/Cocoa state
+        self._context = multiprocessing.get_context("spawn")
+        self._events = None
+        self._worker = None
+        self._done = False
+        self._progress_state: Optional[dict] = None
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(50)
+        self._timer.timeout.connect(self._drain_events)
+    
+    def start(self):
+        """Launch the worker process"""
+        self._events = self._context.Queue()
+        self._worker = self._context.Process(
+            target=run_pipeline,
+            args=(self.tracks, self.images, self.config, self._events),
+            daemon=True
+        )
+        self._worker.start()
+        self._timer.start()
+    
+    def take_progress(self) -> Optional[dict]:
+        """Return the latest progress since the last call, or None if unchanged"""
+        state, self._progress_state = self._progress_state, None
+        return state
+    
+    def _drain_events(self):
+        """Forward queued worker events; progress is coalesced to the latest value"""
+        # Checked before draining: once the worker has exited, everything it
+        # sent is already readable from the queue
+        alive = self._worker.is_alive()
+        
+        while not self._done:
+            try:
+                name, args = self._events.get_nowait()
+            except queue.Empty:
+                break
+            
+            if name == "progress":
+                message, percent, step, total = args
+                self._progress_state = {"message": message, "percent": percent, "step": step, "total": total}
+                continue
+            
+            if name in ("finished", "error"):
+                self._stop()
+            getattr(self, name).emit(*args)
+        
+        if not alive and not self._done:
+            self._stop()
+            self.error.emit(f"Processing worker exited unexpectedly (code {self._worker.exitcode})")
+    
+    def _stop(self):
+        self._done = True
+        self._timer.stop()
+        self._worker.join(timeout=5)
 
 
 class DropZone(QFrame):
@@ -962,62 +1770,38 @@ class DropZone(QFrame):
         self.setAcceptDrops(True)
         self.setMinimumHeight(120)
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
-        
-        # Styling
-        self.setStyleSheet("""
-            DropZone {
-                background-color: #1a1a2e;
-                border: 2px dashed #3d3d5c;
-                border-radius: 12px;
-            }
-            DropZone:hover {
-                border-color: #8B5CF6;
-                background-color: #252542;
-            }
-        """)
+        self.setObjectName("dropZone")
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("color: #e8e8f0; font-size: 16px; font-weight: 500;")
+        self.title_label.setObjectName("dropTitle")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.subtitle_label = QLabel(subtitle)
-        self.subtitle_label.setStyleSheet("color: #6b7280; font-size: 12px;")
+        self.subtitle_label.setObjectName("dropSubtitle")
         self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         layout.addWidget(self.title_label)
         layout.addWidget(self.subtitle_label)
     
+    def _set_dragging(self, dragging: bool):
+        """Switch the highlight via a style property instead of a new stylesheet"""
+        self.setProperty("dragging", dragging)
+        self.style().unpolish(self)
+        self.style().polish(self)
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
-            self.setStyleSheet("""
-                DropZone {
-                    background-color: #252542;
-                    border: 2px dashed #8B5CF6;
-                    border-radius: 12px;
-                }
-            """)
+            self._set_dragging(True)
     
     def dragLeaveEvent(self, event):
-        self.setStyleSheet("""
-            DropZone {
-                background-color: #1a1a2e;
-                border: 2px dashed #3d3d5c;
-                border-radius: 12px;
-            }
-        """)
+        self._set_dragging(False)
     
     def dropEvent(self, event: QDropEvent):
-        self.setStyleSheet("""
-            DropZone {
-                background-color: #1a1a2e;
-                border: 2px dashed #3d3d5c;
-                border-radius: 12px;
-            }
-        """)
+        self._set_dragging(False)
         
         files = [url.toLocalFile() for url in event.mimeData().urls()]
         self.filesDropped.emit(files)
@@ -1031,7 +1815,7 @@ class TrackListWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Shape.NoFrame)
-        self.setStyleSheet("background-color: transparent;")
+        self.setObjectName("trackList")
         
         self.layout = QVBoxLayout(self)
         self.layout.setSpacing(8)
@@ -1039,77 +1823,119 @@ class TrackListWidget(QFrame):
         
         self.tracks = []
         self.track_widgets = []
+        self.layout.addStretch()
     
     def set_tracks(self, tracks: List[AudioTrack]):
-        """Update the track list display"""
-        # Clear existing
-        for widget in self.track_widgets:
+        """
+        Update the track list display. Rows are tied to positions, so existing
+        rows are reused and only their labels change; rows are only created
+        or deleted when the list grows or shrinks.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for i, track in enumerate(tracks):
+                if i < len(self.track_widgets):
+                    widget = self.track_widgets[i]
+                    if widget.track is not track:
+                        self._update_track_widget(widget, track)
+                else:
+                    widget = self._create_track_widget(track, i)
+                    # Keep the trailing stretch last
+                    self.layout.insertWidget(self.layout.count() - 1, widget)
+                    self.track_widgets.append(widget)
+            
+            for widget in self.track_widgets[len(tracks):]:
+                widget.deleteLater()
+            del self.track_widgets[len(tracks):]
+            
+            self.tracks = tracks
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def remove_row(self, index: int):
+        """Remove one row in place; the rows below it are only renumbered"""
+        self.setUpdatesEnabled(False)
+        try:
+            widget = self.track_widgets.pop(index)
+            self.layout.removeWidget(widget)
             widget.deleteLater()
-        self.track_widgets.clear()
-        
-        self.tracks = tracks
-        
-        for i, track in enumerate(tracks):
-            widget = self._create_track_widget(track, i)
-            self.layout.addWidget(widget)
-            self.track_widgets.append(widget)
-        
-        self.layout.addStretch()
+            
+            for i in range(index, len(self.track_widgets)):
+                self.track_widgets[i].badge_label.setPixmap(self._badge_pixmap(i + 1))
+            self.tracks = [widget.track for widget in self.track_widgets]
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _badge_pixmap(number: int) -> QPixmap:
+        """Round track number badge, drawn once per number"""
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(24 * ratio), round(24 * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(TRACK_BADGE_COLOR))
+        painter.drawEllipse(0, 0, 24, 24)
+        
+        font = painter.font()
+        font.setBold(True)
+        font.setPixelSize(12)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(0, 0, 24, 24, Qt.AlignmentFlag.AlignCenter, str(number))
+        painter.end()
+        return pixmap
+    
+    @staticmethod
+    def _track_meta(track: AudioTrack) -> str:
+        return f"{track.duration_formatted} • {track.loudness_lufs:.1f} LUFS • {track.energy_profile.upper()}"
+    
+    def _update_track_widget(self, frame: QFrame, track: AudioTrack):
+        """Point an existing row at another track"""
+        frame.track = track
+        frame.name_label.setText(track.filename)
+        frame.meta_label.setText(self._track_meta(track))
     
     def _create_track_widget(self, track: AudioTrack, index: int) -> QFrame:
         """Create a single track display widget"""
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame {
-                background-color: #252542;
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        frame.setObjectName("trackRow")
+        frame.track = track
         
         layout = QHBoxLayout(frame)
         layout.setContentsMargins(12, 8, 12, 8)
         
         # Number badge
-        number = QLabel(str(index + 1))
-        number.setStyleSheet(f"""
-            background-color: {BINAURAL_PRESETS.get('delta_deep_sleep', {}).get('color', '#8B5CF6')};
-            color: white;
-            border-radius: 12px;
-            padding: 4px 8px;
-            font-weight: bold;
-            font-size: 12px;
-        """)
+        number = QLabel()
+        number.setPixmap(self._badge_pixmap(index + 1))
+        number.setObjectName("trackBadge")
         number.setFixedSize(24, 24)
         number.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Info
         info_layout = QVBoxLayout()
         name = QLabel(track.filename)
-        name.setStyleSheet("color: #e8e8f0; font-weight: 500;")
+        name.setObjectName("trackName")
         
-        meta = QLabel(f"{track.duration_formatted} • {track.loudness_lufs:.1f} LUFS • {track.energy_profile.upper()}")
-        meta.setStyleSheet("color: #6b7280; font-size: 11px;")
+        meta = QLabel(self._track_meta(track))
+        meta.setObjectName("trackMeta")
         
         info_layout.addWidget(name)
         info_layout.addWidget(meta)
+        frame.badge_label = number
+        frame.name_label = name
+        frame.meta_label = meta
         
         # Remove button
         remove_btn = QPushButton("✕")
         remove_btn.setFixedSize(28, 28)
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #ef4444;
-                border: none;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(239, 68, 68, 0.2);
-                border-radius: 4px;
-            }
-        """)
-        remove_btn.clicked.connect(lambda: self.trackRemoved.emit(index))
+        remove_btn.setObjectName("trackRemove")
+        # Rows can shift after remove_row, so look the position up on click
+        remove_btn.clicked.connect(lambda: self.trackRemoved.emit(self.track_widgets.index(frame)))
         
         layout.addWidget(number)
         layout.addLayout(info_layout, 1)
@@ -1121,6 +1947,10 @@ class TrackListWidget(QFrame):
 class FlowStateWindow(QMainWindow):
     """Main application window"""
     
+    ffmpegChecked = pyqtSignal(bool)
+    analysisProgress = pyqtSignal(int, int)  # files done, files total
+    tracksAnalyzed = pyqtSignal(list)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
@@ -1132,13 +1962,36 @@ class FlowStateWindow(QMainWindow):
         self.config = ProjectConfig()
         self.processor: Optional[AudioProcessor] = None
         
-        # Check ffmpeg
-        self.ffmpeg_available = FFmpegAnalyzer.check_ffmpeg()
+        # Poll processor progress at a bounded rate
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(100)
+        self.progress_timer.timeout.connect(self._poll_progress)
         
         self.setup_ui()
         self.apply_dark_theme()
         
-        if not self.ffmpeg_available:
+        # Check ffmpeg off the UI thread so the window paints immediately
+        self.ffmpeg_available: Optional[bool] = None
+        self.ffmpegChecked.connect(self._on_ffmpeg_checked)
+        self.analysisProgress.connect(self._on_analysis_progress)
+        self.tracksAnalyzed.connect(self._on_tracks_analyzed)
+        threading.Thread(target=self._check_ffmpeg, daemon=True).start()
+    
+    def _check_ffmpeg(self):
+        """Background startup check; also warms the encoder cache for exports"""
+        available = FFmpegAnalyzer.check_ffmpeg()
+        self.ffmpegChecked.emit(available)
+        if available:
+            FFmpegAnalyzer.detect_hw_encoder()
+    
+    def _on_ffmpeg_checked(self, available: bool):
+        """Result of the startup ffmpeg check"""
+        # A drop before the check finished may already have resolved it
+        # and shown the warning
+        if self.ffmpeg_available is not None:
+            return
+        self.ffmpeg_available = available
+        if not available:
             self.show_ffmpeg_warning()
     
     def setup_ui(self):
@@ -1164,19 +2017,22 @@ class FlowStateWindow(QMainWindow):
         
         # Content stack
         self.stack = QStackedWidget()
-        self.stack.setStyleSheet("background-color: #0a0a0f;")
+        self.stack.setObjectName("pageStack")
         
         # Page 1: Audio Files
         self.stack.addWidget(self._create_files_page())
         
-        # Page 2: Binaural
-        self.stack.addWidget(self._create_binaural_page())
-        
-        # Page 3: Settings
-        self.stack.addWidget(self._create_settings_page())
-        
-        # Page 4: Video
-        self.stack.addWidget(self._create_video_page())
+        # Pages 2-5 (binaural, settings, video, metadata) are built from
+        # self.config on first visit; until then they're empty placeholders
+        self._page_builders = {
+            "binaural": self._create_binaural_page,
+            "settings": self._create_settings_page,
+            "video": self._create_video_page,
+            "metadata": self._create_metadata_page,
+        }
+        self._built_pages = {"files"}
+        for _ in self._page_builders:
+            self.stack.addWidget(QWidget())
         
         # Select first page
         self.nav_buttons["files"].setChecked(True)
@@ -1196,12 +2052,7 @@ class FlowStateWindow(QMainWindow):
         """Create the left sidebar with navigation"""
         sidebar = QWidget()
         sidebar.setFixedWidth(240)
-        sidebar.setStyleSheet("""
-            QWidget {
-                background-color: #12121a;
-                border-right: 1px solid #1e1e2e;
-            }
-        """)
+        sidebar.setObjectName("sidebar")
         
         layout = QVBoxLayout(sidebar)
         layout.setSpacing(4)
@@ -1209,16 +2060,11 @@ class FlowStateWindow(QMainWindow):
         
         # Logo
         logo = QLabel("🎵 FlowState")
-        logo.setStyleSheet("""
-            color: #8B5CF6;
-            font-size: 20px;
-            font-weight: 600;
-            padding-bottom: 8px;
-        """)
+        logo.setObjectName("logo")
         layout.addWidget(logo)
         
         subtitle = QLabel("Audio Pipeline")
-        subtitle.setStyleSheet("color: #6b7280; font-size: 12px; padding-bottom: 24px;")
+        subtitle.setObjectName("sidebarSubtitle")
         layout.addWidget(subtitle)
         
         # Navigation buttons
@@ -1234,25 +2080,7 @@ class FlowStateWindow(QMainWindow):
         for page_id, icon, label in pages:
             btn = QPushButton(f"{icon}  {label}")
             btn.setCheckable(True)
-            btn.setStyleSheet("""
-                QPushButton {
-                    text-align: left;
-                    padding: 12px 16px;
-                    border: none;
-                    border-radius: 8px;
-                    color: #9ca3af;
-                    font-size: 14px;
-                    background-color: transparent;
-                }
-                QPushButton:hover {
-                    background-color: #1e1e2e;
-                    color: #e8e8f0;
-                }
-                QPushButton:checked {
-                    background-color: #8B5CF6;
-                    color: white;
-                }
-            """)
+            btn.setObjectName("navButton")
             btn.clicked.connect(lambda checked, pid=page_id: self.navigate_to(pid))
             layout.addWidget(btn)
             self.nav_buttons[page_id] = btn
@@ -1261,29 +2089,16 @@ class FlowStateWindow(QMainWindow):
         
         # Template buttons
         template_label = QLabel("Templates")
-        template_label.setStyleSheet("color: #6b7280; font-size: 11px; padding-top: 16px;")
+        template_label.setObjectName("templateLabel")
         layout.addWidget(template_label)
         
         save_template_btn = QPushButton("💾 Save Template")
-        save_template_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1e1e2e;
-                color: #9ca3af;
-                padding: 8px 12px;
-                border: none;
-                border-radius: 6px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #252542;
-                color: #e8e8f0;
-            }
-        """)
+        save_template_btn.setObjectName("templateButton")
         save_template_btn.clicked.connect(self.save_template)
         layout.addWidget(save_template_btn)
         
         load_template_btn = QPushButton("📂 Load Template")
-        load_template_btn.setStyleSheet(save_template_btn.styleSheet())
+        load_template_btn.setObjectName("templateButton")
         load_template_btn.clicked.connect(self.load_template)
         layout.addWidget(load_template_btn)
         
@@ -1291,63 +2106,13 @@ class FlowStateWindow(QMainWindow):
         
         # Export button
         self.export_btn = QPushButton("✨ Create Master Track")
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #8B5CF6, stop:1 #6366F1);
-                color: white;
-                padding: 16px;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #7C3AED, stop:1 #4F46E5);
-            }
-            QPushButton:disabled {
-                background-color: #374151;
-                color: #6b7280;
-            }
-        """)
+        self.export_btn.setObjectName("exportButton")
         self.export_btn.clicked.connect(self.start_processing)
         self.export_btn.setEnabled(False)
         layout.addWidget(self.export_btn)
         
         return sidebar
     
-    def _create_content_area(self) -> QWidget:
-        """Create the main content area with pages"""
-        self.stack = QStackedWidget()
-        self.stack.setStyleSheet("background-color: #0a0a0f;")
-        
-        # Page 1: Audio Files
-        self.stack.addWidget(self._create_files_page())
-        
-        # Page 2: Binaural
-        self.stack.addWidget(self._create_binaural_page())
-        
-        # Page 3: Settings
-        self.stack.addWidget(self._create_settings_page())
-        
-        # Page 4: Video
-        self.stack.addWidget(self._create_video_page())
-        
-        # Page 5: Metadata
-        self.stack.addWidget(self._create_metadata_page())
-        
-        # Page 3: Settings
-        self.stack.addWidget(self._create_settings_page())
-        
-        # Page 4: Video
-        self.stack.addWidget(self._create_video_page())
-        
-        # Select first page
-        self.nav_buttons["files"].setChecked(True)
-        
-        return self.stack
-    
     def _create_files_page(self) -> QWidget:
         """Create the audio files page"""
         page = QWidget()
@@ -1357,11 +2122,11 @@ class FlowStateWindow(QMainWindow):
         
         # Header
         header = QLabel("Audio Files")
-        header.setStyleSheet("color: #e8e8f0; font-size: 28px; font-weight: 600;")
+        header.setObjectName("pageHeader")
         layout.addWidget(header)
         
         desc = QLabel("Drop your audio files. I'll analyze and sequence them for optimal flow.")
-        desc.setStyleSheet("color: #6b7280; font-size: 14px;")
+        desc.setObjectName("pageDescription")
         layout.addWidget(desc)
         
         # Drop zone
@@ -1374,19 +2139,7 @@ class FlowStateWindow(QMainWindow):
         
         # Or browse button
         browse_btn = QPushButton("Or Click to Browse...")
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1e1e2e;
-                color: #9ca3af;
-                padding: 12px 24px;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #252542;
-                color: #e8e8f0;
-            }
-        """)
+        browse_btn.setObjectName("browseButton")
         browse_btn.clicked.connect(self.browse_audio_files)
         layout.addWidget(browse_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
@@ -1398,18 +2151,9 @@ class FlowStateWindow(QMainWindow):
         # Project name
         name_layout = QHBoxLayout()
         name_label = QLabel("Project Name:")
-        name_label.setStyleSheet("color: #9ca3af;")
+        name_label.setProperty("role", "field")
         
         self.project_name = QLineEdit("My Sleep Mix")
-        self.project_name.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px 12px;
-            }
-        """)
         
         name_layout.addWidget(name_label)
         name_layout.addWidget(self.project_name, 1)
@@ -1417,49 +2161,25 @@ class FlowStateWindow(QMainWindow):
         
         # Loop settings
         loop_group = QGroupBox("Loop Settings")
-        loop_group.setStyleSheet("""
-            QGroupBox {
-                color: #8B5CF6;
-                font-weight: 600;
-                border: 1px solid #1e1e2e;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-        """)
         
         loop_layout = QVBoxLayout(loop_group)
         
         # Loop checkbox
         self.loop_checkbox = QCheckBox("Enable Looping")
         self.loop_checkbox.setChecked(True)
-        self.loop_checkbox.setStyleSheet("color: #e8e8f0; font-size: 14px;")
+        self.loop_checkbox.setObjectName("loopCheckbox")
         loop_layout.addWidget(self.loop_checkbox)
         
         # Hours input
         hours_layout = QHBoxLayout()
         hours_label = QLabel("Target Duration:")
-        hours_label.setStyleSheet("color: #9ca3af;")
+        hours_label.setProperty("role", "field")
         
         self.loop_hours = QDoubleSpinBox()
         self.loop_hours.setRange(0.5, 24)
         self.loop_hours.setValue(8)
         self.loop_hours.setDecimals(1)
         self.loop_hours.setSuffix(" hours")
-        self.loop_hours.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
         
         hours_layout.addWidget(hours_label)
         hours_layout.addWidget(self.loop_hours)
@@ -1467,7 +2187,7 @@ class FlowStateWindow(QMainWindow):
         loop_layout.addLayout(hours_layout)
         
         loop_tip = QLabel("💡 The sequence will repeat until it reaches the target duration")
-        loop_tip.setStyleSheet("color: #6b7280; font-size: 11px;")
+        loop_tip.setProperty("role", "tip")
         loop_layout.addWidget(loop_tip)
         
         layout.addWidget(loop_group)
@@ -1484,69 +2204,30 @@ class FlowStateWindow(QMainWindow):
         
         # Header
         header = QLabel("Binaural Beats")
-        header.setStyleSheet("color: #e8e8f0; font-size: 28px; font-weight: 600;")
+        header.setObjectName("pageHeader")
         layout.addWidget(header)
         
         desc = QLabel("Select a frequency preset to enhance the listening experience.")
-        desc.setStyleSheet("color: #6b7280; font-size: 14px;")
+        desc.setObjectName("pageDescription")
         layout.addWidget(desc)
         
         # Preset selector
         preset_group = QGroupBox("Frequency Preset")
-        preset_group.setStyleSheet("""
-            QGroupBox {
-                color: #8B5CF6;
-                font-weight: 600;
-                border: 1px solid #1e1e2e;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-        """)
         
         preset_layout = QVBoxLayout(preset_group)
         
         self.preset_combo = QComboBox()
-        self.preset_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px 12px;
-                min-width: 300px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 12px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                selection-background-color: #8B5CF6;
-            }
-        """)
         
         for key, preset in BINAURAL_PRESETS.items():
             self.preset_combo.addItem(preset["name"], key)
+        self.preset_combo.setCurrentIndex(max(0, self.preset_combo.findData(self.config.binaural_preset)))
         
         self.preset_combo.currentIndexChanged.connect(self.update_preset_info)
         preset_layout.addWidget(self.preset_combo)
         
         # Preset info display
         self.preset_info = QLabel("")
-        self.preset_info.setStyleSheet("""
-            color: #9ca3af;
-            font-size: 13px;
-            padding: 12px;
-            background-color: #1e1e2e;
-            border-radius: 6px;
-        """)
+        self.preset_info.setObjectName("presetInfo")
         self.preset_info.setWordWrap(True)
         preset_layout.addWidget(self.preset_info)
         
@@ -1555,32 +2236,21 @@ class FlowStateWindow(QMainWindow):
         # Custom frequencies
         self.custom_group = QGroupBox("Custom Frequencies")
         self.custom_group.setVisible(False)
-        self.custom_group.setStyleSheet(preset_group.styleSheet())
         
         custom_layout = QGridLayout(self.custom_group)
         
         base_label = QLabel("Base Frequency (Hz):")
-        base_label.setStyleSheet("color: #9ca3af;")
+        base_label.setProperty("role", "field")
         self.base_freq = QDoubleSpinBox()
         self.base_freq.setRange(100, 400)
-        self.base_freq.setValue(200)
-        self.base_freq.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
+        self.base_freq.setValue(self.config.binaural_base_freq)
         
         beat_label = QLabel("Beat Frequency (Hz):")
-        beat_label.setStyleSheet("color: #9ca3af;")
+        beat_label.setProperty("role", "field")
         self.beat_freq = QDoubleSpinBox()
         self.beat_freq.setRange(0.5, 40)
-        self.beat_freq.setValue(2.5)
+        self.beat_freq.setValue(self.config.binaural_beat_freq)
         self.beat_freq.setDecimals(1)
-        self.beat_freq.setStyleSheet(self.base_freq.styleSheet())
         
         custom_layout.addWidget(base_label, 0, 0)
         custom_layout.addWidget(self.base_freq, 0, 1)
@@ -1592,38 +2262,19 @@ class FlowStateWindow(QMainWindow):
         
         # Volume control
         volume_group = QGroupBox("Binaural Volume")
-        volume_group.setStyleSheet(preset_group.styleSheet())
         volume_layout = QVBoxLayout(volume_group)
         
         volume_desc = QLabel("How loud the binaural beat plays under your music. -20 dB is subtle and sleep-safe.")
-        volume_desc.setStyleSheet("color: #6b7280; font-size: 12px;")
+        volume_desc.setProperty("role", "hint")
         volume_layout.addWidget(volume_desc)
         
         volume_slider_layout = QHBoxLayout()
         self.volume_slider = QSlider(Qt.Orientation.Horizontal)
         self.volume_slider.setRange(-40, -10)
-        self.volume_slider.setValue(-20)
-        self.volume_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                height: 6px;
-                background: #1e1e2e;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #8B5CF6;
-                width: 18px;
-                height: 18px;
-                border-radius: 9px;
-                margin: -6px 0;
-            }
-            QSlider::sub-page:horizontal {
-                background: #8B5CF6;
-                border-radius: 3px;
-            }
-        """)
+        self.volume_slider.setValue(int(self.config.binaural_volume_db))
         
-        self.volume_label = QLabel("-20 dB")
-        self.volume_label.setStyleSheet("color: #e8e8f0; min-width: 50px;")
+        self.volume_label = QLabel(f"{self.volume_slider.value()} dB")
+        self.volume_label.setObjectName("volumeLabel")
         self.volume_slider.valueChanged.connect(
             lambda v: self.volume_label.setText(f"{v} dB")
         )
@@ -1650,67 +2301,41 @@ class FlowStateWindow(QMainWindow):
         
         # Header
         header = QLabel("Crossfade & Mix")
-        header.setStyleSheet("color: #e8e8f0; font-size: 28px; font-weight: 600;")
+        header.setObjectName("pageHeader")
         layout.addWidget(header)
         
         desc = QLabel("Fine-tune how tracks blend together.")
-        desc.setStyleSheet("color: #6b7280; font-size: 14px;")
+        desc.setObjectName("pageDescription")
         layout.addWidget(desc)
         
         # Crossfade settings
         fade_group = QGroupBox("Crossfade Settings")
-        fade_group.setStyleSheet("""
-            QGroupBox {
-                color: #8B5CF6;
-                font-weight: 600;
-                border: 1px solid #1e1e2e;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-        """)
         
         fade_layout = QGridLayout(fade_group)
         
         # Crossfade duration
         cf_label = QLabel("Crossfade Duration:")
-        cf_label.setStyleSheet("color: #9ca3af;")
+        cf_label.setProperty("role", "field")
         self.crossfade_spin = QDoubleSpinBox()
         self.crossfade_spin.setRange(1, 30)
-        self.crossfade_spin.setValue(8)
+        self.crossfade_spin.setValue(self.config.crossfade_seconds)
         self.crossfade_spin.setSuffix(" seconds")
-        self.crossfade_spin.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
         
         # Fade in
         fi_label = QLabel("Fade In:")
-        fi_label.setStyleSheet("color: #9ca3af;")
+        fi_label.setProperty("role", "field")
         self.fade_in_spin = QDoubleSpinBox()
         self.fade_in_spin.setRange(0, 10)
-        self.fade_in_spin.setValue(3)
+        self.fade_in_spin.setValue(self.config.fade_in_seconds)
         self.fade_in_spin.setSuffix(" seconds")
-        self.fade_in_spin.setStyleSheet(self.crossfade_spin.styleSheet())
         
         # Fade out
         fo_label = QLabel("Fade Out:")
-        fo_label.setStyleSheet("color: #9ca3af;")
+        fo_label.setProperty("role", "field")
         self.fade_out_spin = QDoubleSpinBox()
         self.fade_out_spin.setRange(0, 30)
-        self.fade_out_spin.setValue(5)
+        self.fade_out_spin.setValue(self.config.fade_out_seconds)
         self.fade_out_spin.setSuffix(" seconds")
-        self.fade_out_spin.setStyleSheet(self.crossfade_spin.styleSheet())
         
         fade_layout.addWidget(cf_label, 0, 0)
         fade_layout.addWidget(self.crossfade_spin, 0, 1)
@@ -1724,19 +2349,17 @@ class FlowStateWindow(QMainWindow):
         
         # Loudness settings
         loud_group = QGroupBox("Loudness (LUFS)")
-        loud_group.setStyleSheet(fade_group.styleSheet())
         loud_layout = QVBoxLayout(loud_group)
         
         loud_desc = QLabel("-16 LUFS is YouTube's standard. Lower values are quieter but more sleep-safe.")
-        loud_desc.setStyleSheet("color: #6b7280; font-size: 12px;")
+        loud_desc.setProperty("role", "hint")
         loud_layout.addWidget(loud_desc)
         
         self.loudness_spin = QDoubleSpinBox()
         self.loudness_spin.setRange(-23, -14)
-        self.loudness_spin.setValue(-16)
+        self.loudness_spin.setValue(self.config.target_loudness_lufs)
         self.loudness_spin.setDecimals(1)
         self.loudness_spin.setSuffix(" LUFS")
-        self.loudness_spin.setStyleSheet(self.crossfade_spin.styleSheet())
         loud_layout.addWidget(self.loudness_spin)
         
         layout.addWidget(loud_group)
@@ -1753,58 +2376,25 @@ class FlowStateWindow(QMainWindow):
         
         # Header
         header = QLabel("Video Options")
-        header.setStyleSheet("color: #e8e8f0; font-size: 28px; font-weight: 600;")
+        header.setObjectName("pageHeader")
         layout.addWidget(header)
         
         desc = QLabel("Choose how your video looks.")
-        desc.setStyleSheet("color: #6b7280; font-size: 14px;")
+        desc.setObjectName("pageDescription")
         layout.addWidget(desc)
         
         # Video mode selection
         mode_group = QGroupBox("Video Mode")
-        mode_group.setStyleSheet("""
-            QGroupBox {
-                color: #8B5CF6;
-                font-weight: 600;
-                border: 1px solid #1e1e2e;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-        """)
         
         mode_layout = QVBoxLayout(mode_group)
         
         self.mode_group = QButtonGroup(self)
         
-        modes = [
-            ("black_screen", "⬛ Black Screen", "Simple black screen, optional intro text"),
-            ("images", "🖼️ Image Slideshow", "Fade between uploaded images"),
-            ("hybrid", "🔀 Hybrid", "Intro → Black → Images → Black"),
-            ("audio_only", "🔊 Audio Only", "Just the audio file, no video"),
-        ]
-        
-        for mode_id, title, description in modes:
+        for mode_id, title, description in VIDEO_MODES:
             radio = QRadioButton(title)
-            radio.setStyleSheet("""
-                QRadioButton {
-                    color: #e8e8f0;
-                    font-size: 14px;
-                    padding: 8px;
-                }
-                QRadioButton::indicator {
-                    width: 18px;
-                    height: 18px;
-                }
-            """)
             
             desc_label = QLabel(description)
-            desc_label.setStyleSheet("color: #6b7280; font-size: 12px; padding-left: 28px;")
+            desc_label.setProperty("role", "optionHint")
             
             self.mode_group.addButton(radio)
             radio.mode_id = mode_id
@@ -1812,46 +2402,31 @@ class FlowStateWindow(QMainWindow):
             mode_layout.addWidget(radio)
             mode_layout.addWidget(desc_label)
         
-        # Select default
-        self.mode_group.buttons()[0].setChecked(True)
+        # Select the configured mode (black screen by default)
+        for radio in self.mode_group.buttons():
+            radio.setChecked(radio.mode_id == self.config.video_mode)
+        if not self.mode_group.checkedButton():
+            self.mode_group.buttons()[0].setChecked(True)
         
         layout.addWidget(mode_group)
         
         # Intro text
         intro_group = QGroupBox("Intro Text (Optional)")
-        intro_group.setStyleSheet(mode_group.styleSheet())
         intro_layout = QVBoxLayout(intro_group)
         
         self.intro_text = QTextEdit()
+        self.intro_text.setPlainText(self.config.intro_text)
         self.intro_text.setPlaceholderText("Welcome to your deep sleep session...")
         self.intro_text.setMaximumHeight(80)
-        self.intro_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
         intro_layout.addWidget(self.intro_text)
         
         intro_dur_layout = QHBoxLayout()
         intro_dur_label = QLabel("Display for:")
-        intro_dur_label.setStyleSheet("color: #9ca3af;")
+        intro_dur_label.setProperty("role", "field")
         self.intro_dur = QSpinBox()
         self.intro_dur.setRange(1, 60)
-        self.intro_dur.setValue(10)
+        self.intro_dur.setValue(int(self.config.intro_duration_seconds))
         self.intro_dur.setSuffix(" seconds")
-        self.intro_dur.setStyleSheet("""
-            QSpinBox {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
         intro_dur_layout.addWidget(intro_dur_label)
         intro_dur_layout.addWidget(self.intro_dur)
         intro_dur_layout.addStretch()
@@ -1882,9 +2457,6 @@ class FlowStateWindow(QMainWindow):
             QMainWindow {
                 background-color: #0a0a0f;
             }
-            QWidget {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            }
             QScrollBar:vertical {
                 background-color: #1e1e2e;
                 width: 12px;
@@ -1913,29 +2485,43 @@ class FlowStateWindow(QMainWindow):
         msg.setIcon(QMessageBox.Icon.Warning)
         msg.exec()
     
+    PAGES = {"files": 0, "binaural": 1, "settings": 2, "video": 3, "metadata": 4}
+    
+    def _ensure_page(self, page_id: str):
+        """Build a page in place of its placeholder on first use"""
+        if page_id in self._built_pages:
+            return
+        index = self.PAGES[page_id]
+        placeholder = self.stack.widget(index)
+        self.stack.insertWidget(index, self._page_builders[page_id]())
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._built_pages.add(page_id)
+    
     def navigate_to(self, page_id: str):
         """Navigate to a specific page"""
-        pages = {"files": 0, "binaural": 1, "settings": 2, "video": 3, "metadata": 4}
-        if page_id in pages:
-            self.stack.setCurrentIndex(pages[page_id])
+        if page_id in self.PAGES:
+            index = self.PAGES[page_id]
+            if self.stack.currentIndex() != index:
+                self._ensure_page(page_id)
+                self.stack.setCurrentIndex(index)
             
-            # Update button states
+            # Update button states. Still needed for the current page: the
+            # buttons aren't exclusive, so clicking it again unchecks it
             for pid, btn in self.nav_buttons.items():
-                btn.setChecked(pid == page_id)
+                checked = pid == page_id
+                if btn.isChecked() != checked:
+                    btn.setChecked(checked)
     
     def update_preset_info(self):
         """Update the preset information display"""
         preset_key = self.preset_combo.currentData()
-        preset = BINAURAL_PRESETS.get(preset_key, BINAURAL_PRESETS["delta_deep_sleep"])
-        
-        info_text = f"""
-        <b>Base:</b> {preset['base']} Hz | <b>Beat:</b> {preset['beat']} Hz<br><br>
-        {preset['description']}
-        """
-        self.preset_info.setText(info_text)
+        self.preset_info.setText(PRESET_INFO_HTML.get(preset_key, PRESET_INFO_HTML["delta_deep_sleep"]))
         
-        # Show/hide custom controls
-        self.custom_group.setVisible(preset_key == "custom")
+        # Show/hide custom controls, only when that actually changes
+        show_custom = preset_key == "custom"
+        if self.custom_group.isHidden() == show_custom:
+            self.custom_group.setVisible(show_custom)
     
     def browse_audio_files(self):
         """Open file dialog for audio files"""
@@ -1950,39 +2536,40 @@ class FlowStateWindow(QMainWindow):
     
     def handle_audio_drops(self, files: List[str]):
         """Handle dropped audio files"""
-        audio_files = [f for f in files if f.lower().endswith(
-            ('.mp3', '.wav', '.flac', '.aac', '.m4a', '.ogg')
-        )]
+        audio_files = [f for f in files if os.path.splitext(f)[1].lower() in AUDIO_EXTENSIONS]
         if audio_files:
             self.process_audio_files(audio_files)
     
     def handle_image_drops(self, files: List[str]):
         """Handle dropped image files"""
-        image_files = [f for f in files if f.lower().endswith(
-            ('.jpg', '.jpeg', '.png', '.webp', '.gif')
-        )]
+        image_files = [f for f in files if os.path.splitext(f)[1].lower() in IMAGE_EXTENSIONS]
         self.images.extend(image_files)
         self.statusBar().showMessage(f"Added {len(image_files)} images")
     
     def process_audio_files(self, files: List[str]):
         """Analyze and add audio files"""
+        if self.ffmpeg_available is None:
+            # Startup check still running; the result is cached
+            self.ffmpeg_available = FFmpegAnalyzer.check_ffmpeg()
         if not self.ffmpeg_available:
             self.show_ffmpeg_warning()
             return
         
         self.statusBar().showMessage("Analyzing audio files...")
         
-        # Analyze in background
-        analyzer = FFmpegAnalyzer()
-        new_tracks = []
-        
-        for filepath in files:
-            try:
-                track = analyzer.analyze(filepath)
-                new_tracks.append(track)
-            except Exception as e:
-                print(f"Error analyzing {filepath}: {e}")
+        # Analyze off the GUI thread so the window stays responsive;
+        # results come back through signals
+        def analyze():
+            new_tracks = FFmpegAnalyzer().analyze_many(files, on_progress=self.analysisProgress.emit)
+            self.tracksAnalyzed.emit(new_tracks)
         
+        threading.Thread(target=analyze, daemon=True).start()
+    
+    def _on_analysis_progress(self, done: int, total: int):
+        self.statusBar().showMessage(f"Analyzing audio files... {done}/{total}")
+    
+    def _on_tracks_analyzed(self, new_tracks: List[AudioTrack]):
+        """Add freshly analyzed tracks and re-sequence"""
         # Add to existing tracks
         self.tracks.extend(new_tracks)
         
@@ -1994,9 +2581,7 @@ class FlowStateWindow(QMainWindow):
         self.track_list.set_tracks(self.tracks)
         self.export_btn.setEnabled(len(self.tracks) > 0)
         
-        total_duration = sum(t.duration for t in self.tracks)
-        mins = int(total_duration // 60)
-        secs = int(total_duration % 60)
+        mins, secs = divmod(int(sum(t.duration for t in self.tracks)), 60)
         self.statusBar().showMessage(
             f"Added {len(new_tracks)} tracks. Total: {len(self.tracks)} tracks, {mins}:{secs:02d}"
         )
@@ -2005,7 +2590,7 @@ class FlowStateWindow(QMainWindow):
         """Remove a track from the list"""
         if 0 <= index < len(self.tracks):
             self.tracks.pop(index)
-            self.track_list.set_tracks(self.tracks)
+            self.track_list.remove_row(index)
             self.export_btn.setEnabled(len(self.tracks) > 0)
     
     def start_processing(self):
@@ -2020,42 +2605,59 @@ class FlowStateWindow(QMainWindow):
         self.config.loop_mode = self.loop_checkbox.isChecked()
         self.config.target_duration_minutes = self.loop_hours.value() * 60
         
+        # Pages that were never opened still hold the config values
         # Binaural settings
-        self.config.binaural_preset = self.preset_combo.currentData()
-        self.config.binaural_base_freq = self.base_freq.value()
-        self.config.binaural_beat_freq = self.beat_freq.value()
-        self.config.binaural_volume_db = self.volume_slider.value()
+        if "binaural" in self._built_pages:
+            self.config.binaural_preset = self.preset_combo.currentData()
+            self.config.binaural_base_freq = self.base_freq.value()
+            self.config.binaural_beat_freq = self.beat_freq.value()
+            self.config.binaural_volume_db = self.volume_slider.value()
         
         # Crossfade settings
-        self.config.crossfade_seconds = self.crossfade_spin.value()
-        self.config.fade_in_seconds = self.fade_in_spin.value()
-        self.config.fade_out_seconds = self.fade_out_spin.value()
-        self.config.target_loudness_lufs = self.loudness_spin.value()
+        if "settings" in self._built_pages:
+            self.config.crossfade_seconds = self.crossfade_spin.value()
+            self.config.fade_in_seconds = self.fade_in_spin.value()
+            self.config.fade_out_seconds = self.fade_out_spin.value()
+            self.config.target_loudness_lufs = self.loudness_spin.value()
         
         # Video settings
-        selected_mode = self.mode_group.checkedButton()
-        self.config.video_mode = selected_mode.mode_id if selected_mode else "black_screen"
-        self.config.intro_text = self.intro_text.toPlainText()
-        self.config.intro_duration_seconds = self.intro_dur.value()
+        if "video" in self._built_pages:
+            selected_mode = self.mode_group.checkedButton()
+            self.config.video_mode = selected_mode.mode_id if selected_mode else "black_screen"
+            self.config.intro_text = self.intro_text.toPlainText()
+            self.config.intro_duration_seconds = self.intro_dur.value()
         
         # YouTube metadata
-        self.config.youtube_title = self.youtube_title.text()
-        self.config.youtube_description = self.youtube_description.toPlainText()
-        self.config.youtube_tags = self.youtube_tags.text()
+        if "metadata" in self._built_pages:
+            self.config.youtube_title = self.youtube_title.text()
+            self.config.youtube_description = self.youtube_description.toPlainText()
+            self.config.youtube_tags = self.youtube_tags.text()
         
         # Disable UI during processing
         self.export_btn.setEnabled(False)
         self.export_btn.setText("Processing...")
         self.status_panel.show_panel()
         
+        # Resolved here, where it is cached, so the worker process never probes
+        if self.config.video_mode != "audio_only":
+            self.config.video_encoder = FFmpegAnalyzer.detect_hw_encoder()
+        
         # Start processor thread
         self.processor = AudioProcessor(self.tracks, self.images, self.config)
-        self.processor.progress.connect(self.update_progress)
         self.processor.stage_started.connect(self.on_stage_started)
         self.processor.stage_completed.connect(self.on_stage_completed)
         self.processor.finished.connect(self.processing_finished)
         self.processor.error.connect(self.processing_error)
         self.processor.start()
+        self.progress_timer.start()
+    
+    def _poll_progress(self):
+        """Pull the latest progress from the processor"""
+        if not self.processor:
+            return
+        state = self.processor.take_progress()
+        if state:
+            self.update_progress(state["message"], state["percent"], state["step"], state["total"])
     
     def on_stage_started(self, stage_id: str, description: str):
         """Handle stage start"""
@@ -2074,11 +2676,16 @@ class FlowStateWindow(QMainWindow):
     
     def processing_finished(self, results: dict):
         """Handle successful completion"""
+        self.progress_timer.stop()
         self.status_panel.update_progress("Complete!", 100, 6, 6)
         
         # Mark all stages complete
-        for stage_id in ["sequencing", "binaural", "mixing", "exporting", "video", "finalizing"]:
-            self.status_panel.set_stage_complete(stage_id)
+        self.status_panel.set_all_stages_complete()
+        
+        # Export YouTube metadata as text file (on by default). It is written
+        # in the background while the dialog is up
+        if "metadata" not in self._built_pages or self.export_txt_checkbox.isChecked():
+            self._export_youtube_metadata()
         
         # Show success message
         audio_path = results.get("audio_path", "")
@@ -2103,11 +2710,8 @@ class FlowStateWindow(QMainWindow):
         msg.exec()
         
         if msg.clickedButton() == open_btn:
-            subprocess.run(["open", str(EXPORTS_DIR)])
-        
-        # Export YouTube metadata as text file
-        if self.export_txt_checkbox.isChecked():
-            self._export_youtube_metadata()
+            # Hands off to Finder without waiting on an `open` process
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(EXPORTS_DIR)))
         
         # Reset UI
         self.export_btn.setEnabled(True)
@@ -2117,46 +2721,34 @@ class FlowStateWindow(QMainWindow):
     
     def _export_youtube_metadata(self):
         """Export YouTube metadata as a text file"""
-        safe_name = "".join(c for c in self.config.project_name if c.isalnum() or c in "-_ ").strip()
+        safe_name = _UNSAFE_NAME_RE.sub("", self.config.project_name).strip()
         if not safe_name:
             safe_name = "flowstate_export"
         
         metadata_file = EXPORTS_DIR / f"{safe_name}_youtube_metadata.txt"
         
-        content = f"""YOUTUBE UPLOAD METADATA
-{'='*50}
-
-TITLE:
-{self.config.youtube_title or self.config.project_name}
-
-DESCRIPTION:
-{self.config.youtube_description}
-
-TAGS:
-{self.config.youtube_tags}
-
-CATEGORY:
-Music
-
-SETTINGS:
-• Made for kids: No
-• License: Standard YouTube License
-• Comments: Allow all comments
-
-AUDIO SPECS:
-• Duration: {self.config.target_duration_minutes} minutes
-• Binaural: {BINAURAL_PRESETS.get(self.config.binaural_preset, {}).get('name', 'Custom')}
-• Loudness: {self.config.target_loudness_lufs} LUFS
-
-Exported by FlowState Audio
-https://github.com/lizardflaco/flowstate-audio
-"""
+        preset = self.config.binaural_preset
+        content = YOUTUBE_METADATA_TEMPLATE.format_map({
+            "title": self.config.youtube_title or self.config.project_name,
+            "description": self.config.youtube_description,
+            "tags": self.config.youtube_tags,
+            "duration": self.config.target_duration_minutes,
+            "preset": BINAURAL_PRESETS[preset]["name"] if preset in BINAURAL_PRESETS else "Custom",
+            "loudness": self.config.target_loudness_lufs,
+        })
+        
+        def write():
+            try:
+                metadata_file.write_text(content, encoding='utf-8')
+            except OSError as e:
+                print(f"Could not save YouTube metadata: {e}")
         
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Not a daemon, so quitting right away still finishes the write
+        threading.Thread(target=write).start()
     
     def processing_error(self, error_msg: str):
         """Handle processing error"""
+        self.progress_timer.stop()
         self.status_panel.hide_panel()
         
         msg = QMessageBox(self)
@@ -2179,57 +2771,33 @@ https://github.com/lizardflaco/flowstate-audio
         
         # Header
         header = QLabel("YouTube & Export")
-        header.setStyleSheet("color: #e8e8f0; font-size: 28px; font-weight: 600;")
+        header.setObjectName("pageHeader")
         layout.addWidget(header)
         
         desc = QLabel("Add metadata for YouTube and export options.")
-        desc.setStyleSheet("color: #6b7280; font-size: 14px;")
+        desc.setObjectName("pageDescription")
         layout.addWidget(desc)
         
         # YouTube Title
         title_group = QGroupBox("YouTube Title")
-        title_group.setStyleSheet("""
-            QGroupBox {
-                color: #8B5CF6;
-                font-weight: 600;
-                border: 1px solid #1e1e2e;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-        """)
         title_layout = QVBoxLayout(title_group)
         
-        self.youtube_title = QLineEdit()
+        self.youtube_title = QLineEdit(self.config.youtube_title)
         self.youtube_title.setPlaceholderText("e.g., 8 Hour Deep Sleep Music with Delta Waves")
-        self.youtube_title.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px 12px;
-            }
-        """)
         title_layout.addWidget(self.youtube_title)
         
         title_tip = QLabel("💡 Include duration and key benefit in the title")
-        title_tip.setStyleSheet("color: #6b7280; font-size: 11px;")
+        title_tip.setProperty("role", "tip")
         title_layout.addWidget(title_tip)
         
         layout.addWidget(title_group)
         
         # YouTube Description
         desc_group = QGroupBox("YouTube Description")
-        desc_group.setStyleSheet(title_group.styleSheet())
         desc_layout = QVBoxLayout(desc_group)
         
         self.youtube_description = QTextEdit()
+        self.youtube_description.setPlainText(self.config.youtube_description)
         self.youtube_description.setPlaceholderText("""Welcome to this deep sleep meditation...
 
 🎵 Benefits:
@@ -2247,43 +2815,30 @@ This track uses Delta waves (2.5 Hz) to help you achieve deep sleep.
 
 #SleepMusic #BinauralBeats #DeepSleep""")
         self.youtube_description.setMaximumHeight(200)
-        self.youtube_description.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e2e;
-                color: #e8e8f0;
-                border: 1px solid #2d2d3d;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
         desc_layout.addWidget(self.youtube_description)
         
         desc_tip = QLabel("💡 Include timestamps, benefits, and hashtags")
-        desc_tip.setStyleSheet("color: #6b7280; font-size: 11px;")
+        desc_tip.setProperty("role", "tip")
         desc_layout.addWidget(desc_tip)
         
         layout.addWidget(desc_group)
         
         # Tags
         tags_group = QGroupBox("Tags (comma separated)")
-        tags_group.setStyleSheet(title_group.styleSheet())
         tags_layout = QVBoxLayout(tags_group)
         
-        self.youtube_tags = QLineEdit()
+        self.youtube_tags = QLineEdit(self.config.youtube_tags)
         self.youtube_tags.setPlaceholderText("sleep music, binaural beats, delta waves, deep sleep, meditation, relaxation")
-        self.youtube_tags.setStyleSheet(self.youtube_title.styleSheet())
         tags_layout.addWidget(self.youtube_tags)
         
         layout.addWidget(tags_group)
         
         # Export Options
         export_group = QGroupBox("Export Options")
-        export_group.setStyleSheet(title_group.styleSheet())
         export_layout = QVBoxLayout(export_group)
         
         self.export_txt_checkbox = QCheckBox("Export YouTube metadata as .txt file")
         self.export_txt_checkbox.setChecked(True)
-        self.export_txt_checkbox.setStyleSheet("color: #e8e8f0;")
         export_layout.addWidget(self.export_txt_checkbox)
         
         layout.addWidget(export_group)
@@ -2300,9 +2855,10 @@ This track uses Delta waves (2.5 Hz) to help you achieve deep sleep.
         if filename:
             # Update config from UI
             self.config.project_name = self.project_name.text()
-            self.config.youtube_title = self.youtube_title.text()
-            self.config.youtube_description = self.youtube_description.toPlainText()
-            self.config.youtube_tags = self.youtube_tags.text()
+            if "metadata" in self._built_pages:
+                self.config.youtube_title = self.youtube_title.text()
+                self.config.youtube_description = self.youtube_description.toPlainText()
+                self.config.youtube_tags = self.youtube_tags.text()
             
             self.config.save_to_file(filename)
             QMessageBox.information(self, "Template Saved", f"Template saved to:\n{filename}")
@@ -2317,21 +2873,28 @@ This track uses Delta waves (2.5 Hz) to help you achieve deep sleep.
             try:
                 self.config = ProjectConfig.load_from_file(filename)
                 
-                # Update UI
+                # Update UI; unbuilt pages pick the values up from self.config
                 self.project_name.setText(self.config.project_name)
-                self.youtube_title.setText(self.config.youtube_title)
-                self.youtube_description.setText(self.config.youtube_description)
-                self.youtube_tags.setText(self.config.youtube_tags)
+                if "metadata" in self._built_pages:
+                    self.youtube_title.setText(self.config.youtube_title)
+                    self.youtube_description.setText(self.config.youtube_description)
+                    self.youtube_tags.setText(self.config.youtube_tags)
                 
                 # Update other UI elements
-                self.preset_combo.setCurrentIndex(
-                    self.preset_combo.findData(self.config.binaural_preset)
-                )
-                self.base_freq.setValue(self.config.binaural_base_freq)
-                self.beat_freq.setValue(self.config.binaural_beat_freq)
-                self.volume_slider.setValue(int(self.config.binaural_volume_db))
-                self.crossfade_spin.setValue(self.config.crossfade_seconds)
-                self.loudness_spin.setValue(self.config.target_loudness_lufs)
+                if "binaural" in self._built_pages:
+                    # Set values silently, then refresh the dependent labels once
+                    with QSignalBlocker(self.preset_combo), QSignalBlocker(self.volume_slider):
+                        self.preset_combo.setCurrentIndex(
+                            self.preset_combo.findData(self.config.binaural_preset)
+                        )
+                        self.volume_slider.setValue(int(self.config.binaural_volume_db))
+                    self.base_freq.setValue(self.config.binaural_base_freq)
+                    self.beat_freq.setValue(self.config.binaural_beat_freq)
+                    self.update_preset_info()
+                    self.volume_label.setText(f"{self.volume_slider.value()} dB")
+                if "settings" in self._built_pages:
+                    self.crossfade_spin.setValue(self.config.crossfade_seconds)
+                    self.loudness_spin.setValue(self.config.target_loudness_lufs)
                 
                 QMessageBox.information(self, "Template Loaded", "Template loaded successfully!")
             except Exception as e:
@@ -2340,12 +2903,18 @@ This track uses Delta waves (2.5 Hz) to help you achieve deep sleep.
 
 def main():
     """Application entry point"""
+    multiprocessing.freeze_support()
+    
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
+    app.setStyleSheet(APP_STYLESHEET)
     
-    # Set application font
-    font = QFont("-apple-system", 13)
+    # Set application font. Take the platform UI font directly: naming a
+    # family Qt doesn't know (like "-apple-system") makes it scan every
+    # installed font for aliases at startup
+    font = QFontDatabase.systemFont(QFontDatabase.SystemFont.GeneralFont)
+    font.setPointSize(13)
     font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
     app.setFont(font)
     
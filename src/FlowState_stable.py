@@ -5,8 +5,17 @@ Simplified, working audio pipeline for Jud
 """
 
 import sys
+import os
 import subprocess
 import json
+import struct
+import math
+import tempfile
+import threading
+from collections import deque
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
@@ -27,6 +36,7 @@ except ImportError:
 # Paths
 EXPORTS_DIR = Path.home() / "Desktop" / "FlowState Exports"
 EXPORTS_DIR.mkdir(exist_ok=True)
+DURATION_CACHE_FILE = EXPORTS_DIR / ".duration_cache.json"
 
 BINAURAL_PRESETS = {
     "delta": {"name": "Delta (2.5 Hz) - Deep Sleep", "base": 200, "beat": 2.5},
@@ -34,6 +44,150 @@ BINAURAL_PRESETS = {
     "alpha": {"name": "Alpha (10 Hz) - Focus", "base": 200, "beat": 10.0},
 }
 
+# A still black frame at 1 fps is all the video encoder needs
+BLACK_VIDEO = "color=c=black:s=1920x1080:r=1"
+VIDEO_ARGS = ["-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage",
+              "-threads", "0", "-g", "300", "-pix_fmt", "yuv420p",
+              "-c:a", "aac", "-b:a", "192k"]
+
+# Mixes up to this long are looped with aloop, which holds the whole mix in
+# memory (~230 MB for 10 minutes); longer ones are looped from a temp FLAC
+ALOOP_MAX_SECONDS = 600
+
+# Lines of ffmpeg's stderr kept to explain a failed run
+FFMPEG_ERROR_TAIL_LINES = 20
+
+
+def binaural_period(base, beat, sample_rate=48000):
+    """
+    Samples after which both binaural tones complete whole cycles together,
+    e.g. 4800 for 200/210 Hz. The pair can be rendered once for this long
+    and looped; returns None when that repeat would be impractically long.
+    """
+    left = Fraction(str(base)) / sample_rate
+    right = Fraction(str(base + beat)) / sample_rate
+    period = math.lcm(left.denominator, right.denominator)
+    return period if period <= sample_rate * 10 else None
+
+
+@lru_cache(maxsize=32)
+def mix_filter(n_inputs, preset_key, volume, loop=False, split=False, duration=None):
+    """
+    The filter graph that sequences the inputs and mixes in the binaural
+    tones as [out]. loop repeats the mix endlessly; split adds a second
+    copy as [vid] for the video output. A single input is faded in and,
+    over the end of its `duration`, out.
+    """
+    preset = BINAURAL_PRESETS[preset_key]
+    if n_inputs == 1:
+        seq_filter = f"[0:a]afade=t=in:ss=0:d=3,afade=t=out:st={max(0, duration - 5)}:d=5[seq]"
+    else:
+        # Simple concat for stability
+        seq_filter = "".join(f"[{i}:a]" for i in range(n_inputs)) + f"concat=n={n_inputs}:v=0:a=1[seq]"
+    
+    # The tones repeat exactly, so one period is rendered and looped
+    period = binaural_period(preset['base'], preset['beat'])
+    tile = f",atrim=end_sample={period},aloop=loop=-1:size={period}" if period else ""
+    
+    mix = "[seq][bin]amix=2:duration=first"
+    if loop:
+        mix += ",aloop=loop=-1:size=2147483647"
+    mix += ",asplit=2[out][vid]" if split else "[out]"
+    
+    return ";".join([
+        seq_filter,
+        f"sine=frequency={preset['base']}:sample_rate=48000[l]",
+        f"sine=frequency={preset['base']+preset['beat']}:sample_rate=48000[r]",
+        f"[l][r]join=inputs=2:channel_layout=stereo,volume={volume}dB{tile}[bin]",
+        mix,
+    ])
+
+
+def wav_duration(path):
+    """Duration of a PCM WAV read from its header, or None if it isn't one"""
+    try:
+        with open(path, "rb") as f:
+            riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+            if riff != b"RIFF" or wave_id != b"WAVE":
+                return None
+            
+            byte_rate = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                chunk_id, size = struct.unpack("<4sI", header)
+                if chunk_id == b"fmt ":
+                    byte_rate = struct.unpack("<HHII", f.read(12))[3]
+                    f.seek(size - 12 + (size & 1), os.SEEK_CUR)
+                elif chunk_id == b"data":
+                    # 0 / 0xFFFFFFFF: streamed WAV whose size was never filled in
+                    if not byte_rate or size in (0, 0xFFFFFFFF):
+                        return None
+                    available = os.fstat(f.fileno()).st_size - f.tell()
+                    return min(size, available) / byte_rate
+                else:
+                    f.seek(size + (size & 1), os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+
+_duration_cache = None
+
+
+def _load_duration_cache():
+    global _duration_cache
+    if _duration_cache is None:
+        try:
+            _duration_cache = json.loads(DURATION_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            _duration_cache = {}
+    return _duration_cache
+
+
+def save_duration_cache():
+    if _duration_cache is not None:
+        try:
+            DURATION_CACHE_FILE.write_text(json.dumps(_duration_cache))
+        except OSError:
+            pass
+
+
+def probe_duration(path):
+    """Duration in seconds: WAV headers are read directly, anything else via ffprobe"""
+    dur = wav_duration(path)
+    if dur is not None:
+        return dur
+    
+    # ffprobe results are remembered across runs until the file changes
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    cache = _load_duration_cache()
+    entry = cache.get(key)
+    if entry and entry[:2] == [st.st_size, st.st_mtime_ns]:
+        return entry[2]
+    
+    cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+           "-of", "json", path]
+    r = subprocess.run(cmd, capture_output=True, text=True)
+    dur = float(json.loads(r.stdout)['format']['duration'])
+    cache[key] = [st.st_size, st.st_mtime_ns, dur]
+    return dur
+
+
+def check_decodes(path):
+    """Dry-run decode of the whole file so a corrupt input fails before any rendering"""
+    r = subprocess.run(["ffmpeg", "-nostdin", "-v", "error", "-xerror", "-i", path,
+                        "-f", "null", "-"], capture_output=True, text=True)
+    if r.returncode != 0:
+        lines = r.stderr.strip().splitlines()
+        raise RuntimeError(f"Can't decode {Path(path).name}: {lines[0] if lines else 'unknown error'}")
+
+
+def analyze_file(path):
+    check_decodes(path)
+    return probe_duration(path)
+
 
 @dataclass
 class ProjectConfig:
@@ -63,96 +217,101 @@ class AudioProcessor(QThread):
         except Exception as e:
             self.error.emit(str(e))
     
+    def run_ffmpeg(self, cmd, message, start, end, duration):
+        """
+        Run ffmpeg, moving the progress bar from start to end as its output
+        time advances. Raises RuntimeError with the end of ffmpeg's stderr
+        if it fails.
+        """
+        self.progress.emit(message, start)
+        proc = subprocess.Popen([cmd[0], "-hide_banner", "-progress", "pipe:1", "-nostats"] + cmd[1:],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, errors="replace")
+        # Drained on its own thread so a chatty stderr can't block ffmpeg
+        tail = deque(maxlen=FFMPEG_ERROR_TAIL_LINES)
+        reader = threading.Thread(target=lambda: tail.extend(line.rstrip() for line in proc.stderr),
+                                  daemon=True)
+        reader.start()
+        last = start
+        for line in proc.stdout:
+            key, _, value = line.strip().partition("=")
+            # out_time_ms is in microseconds too, despite the name
+            if key in ("out_time_us", "out_time_ms") and value.isdigit() and duration:
+                pct = start + int(min(1.0, int(value) / (duration * 1e6)) * (end - start))
+                if pct != last:
+                    last = pct
+                    self.progress.emit(message, pct)
+        proc.wait()
+        reader.join()
+        
+        if proc.returncode != 0:
+            raise RuntimeError("ffmpeg failed:\n" + "\n".join(tail))
+    
     def process(self):
         # Step 1: Analyze files
         self.progress.emit("Analyzing audio files...", 10)
-        durations = []
-        for f in self.files:
-            cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                   "-of", "json", f]
-            r = subprocess.run(cmd, capture_output=True, text=True)
-            dur = float(json.loads(r.stdout)['format']['duration'])
-            durations.append(dur)
+        # ffmpeg/ffprobe runs are independent child processes, so check and
+        # probe the files side by side
+        _load_duration_cache()
+        with ThreadPoolExecutor(max_workers=min(8, len(self.files))) as ex:
+            durations = list(ex.map(analyze_file, self.files))
+        save_duration_cache()
         
         total_duration = sum(durations)
-        
-        # Step 2: Build sequence
-        self.progress.emit("Building audio sequence...", 30)
-        seq_file = f"/tmp/sequenced.wav"
-        
-        if len(self.files) == 1:
-            subprocess.run(["ffmpeg", "-y", "-i", self.files[0],
-                          "-af", f"afade=t=in:ss=0:d=3,afade=t=out:st=0:d=5",
-                          "-c:a", "pcm_s24le", seq_file], capture_output=True)
-        else:
-            # Concatenate with crossfade
-            inputs = []
-            for f in self.files:
-                inputs.extend(["-i", f])
-            
-            # Simple concat for stability
-            filter_str = ""
-            for i in range(len(self.files)):
-                filter_str += f"[{i}:a]"
-            filter_str += f"concat=n={len(self.files)}:v=0:a=1[out]"
-            
-            cmd = ["ffmpeg", "-y"] + inputs + [
-                "-filter_complex", filter_str,
-                "-map", "[out]",
-                "-c:a", "pcm_s24le", seq_file
-            ]
-            subprocess.run(cmd, capture_output=True)
-        
-        # Step 3: Generate binaural
-        self.progress.emit("Generating binaural beats...", 50)
-        preset = BINAURAL_PRESETS[self.config.binaural_preset]
-        
-        probe = subprocess.run(["ffprobe", "-v", "error", "-show_entries",
-                               "format=duration", "-of", "json", seq_file],
-                              capture_output=True, text=True)
-        duration = float(json.loads(probe.stdout)['format']['duration'])
-        
-        binaural_file = "/tmp/binaural.wav"
-        subprocess.run(["ffmpeg", "-y", "-f", "lavfi",
-                       "-i", f"sine=frequency={preset['base']}:sample_rate=48000",
-                       "-f", "lavfi",
-                       "-i", f"sine=frequency={preset['base']+preset['beat']}:sample_rate=48000",
-                       "-filter_complex", "[0:a][1:a]join=inputs=2:channel_layout=stereo",
-                       "-t", str(duration), "-c:a", "pcm_s24le", binaural_file],
-                      capture_output=True)
-        
-        # Step 4: Mix and loop if needed
-        self.progress.emit("Mixing audio...", 70)
-        mixed_file = "/tmp/mixed.wav"
-        
-        subprocess.run(["ffmpeg", "-y", "-i", seq_file, "-i", binaural_file,
-                       "-filter_complex", f"[1:a]volume={self.config.binaural_volume}dB[bin];[0:a][bin]amix=2",
-                       "-c:a", "pcm_s24le", mixed_file], capture_output=True)
-        
-        # Loop if needed
         target_duration = self.config.loop_hours * 3600
-        if duration < target_duration:
-            self.progress.emit(f"Looping to {self.config.loop_hours} hours...", 80)
-            final_file = "/tmp/final.wav"
-            subprocess.run(["ffmpeg", "-y", "-stream_loop", "-1", "-i", mixed_file,
-                           "-t", str(target_duration), "-c:a", "pcm_s24le", final_file],
-                          capture_output=True)
-            mixed_file = final_file
-        
-        # Step 5: Export
-        self.progress.emit("Exporting...", 90)
+        needs_loop = total_duration < target_duration
+        two_pass = needs_loop and total_duration > ALOOP_MAX_SECONDS
+        
         safe_name = "".join(c for c in self.config.project_name if c.isalnum() or c in "-_ ").strip()
         audio_out = str(EXPORTS_DIR / f"{safe_name}_master.wav")
         video_out = str(EXPORTS_DIR / f"{safe_name}.mp4")
         
-        subprocess.run(["cp", mixed_file, audio_out], capture_output=True)
+        # Steps 2-4: sequence, binaural and mix in one ffmpeg graph so the
+        # intermediate WAVs never touch disk. Unless the mix is too long to
+        # loop in memory, the master and video are exported from the same run.
         
-        # Create video
-        subprocess.run(["ffmpeg", "-y", "-f", "lavfi",
-                       "-i", "color=c=black:s=1920x1080:r=30",
-                       "-i", mixed_file, "-t", str(target_duration if duration < target_duration else duration),
-                       "-c:v", "libx264", "-c:a", "aac", "-b:a", "192k",
-                       "-shortest", video_out], capture_output=True)
+        inputs = []
+        for f in self.files:
+            inputs.extend(["-i", f])
+        
+        n = len(self.files)
+        filter_str = mix_filter(n, self.config.binaural_preset, self.config.binaural_volume,
+                                loop=needs_loop and not two_pass, split=not two_pass,
+                                duration=durations[0] if n == 1 else None)
+        
+        if two_pass:
+            # A private temp per export, so concurrent exports can't collide
+            with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as tmp:
+                mixed_file = tmp.name
+            try:
+                self.run_ffmpeg(["ffmpeg", "-y"] + inputs + [
+                                "-filter_complex", filter_str,
+                                "-map", "[out]",
+                                "-c:a", "flac", "-compression_level", "0", mixed_file],
+                                "Building audio sequence...", 30, 60, total_duration)
+            
+                # Loop, then write the master WAV and the video side by side
+                # from the same decoded audio
+                t = str(target_duration)
+                self.run_ffmpeg(["ffmpeg", "-y", "-stream_loop", "-1", "-i", mixed_file,
+                                "-f", "lavfi", "-i", BLACK_VIDEO,
+                                "-map", "0:a", "-t", t, "-c:a", "pcm_s24le", audio_out,
+                                "-map", "1:v", "-map", "0:a", "-t", t] + VIDEO_ARGS + [video_out],
+                                f"Looping to {self.config.loop_hours} hours...", 60, 95, target_duration)
+            finally:
+                os.unlink(mixed_file)
+        else:
+            if needs_loop:
+                t, message = str(target_duration), f"Looping to {self.config.loop_hours} hours..."
+            else:
+                t, message = str(total_duration), "Mixing and exporting..."
+            self.run_ffmpeg(["ffmpeg", "-y"] + inputs + [
+                            "-f", "lavfi", "-i", BLACK_VIDEO,
+                            "-filter_complex", filter_str,
+                            "-map", "[out]", "-t", t, "-c:a", "pcm_s24le", audio_out,
+                            "-map", f"{n}:v", "-map", "[vid]", "-t", t] + VIDEO_ARGS + [
+                            "-shortest", video_out],
+                            message, 30, 95, float(t))
         
         # Export metadata
         if self.config.youtube_title:
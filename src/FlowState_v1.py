@@ -16,13 +16,16 @@ Install: brew install ffmpeg && pip install PyQt6 numpy
 
 import sys
 import os
+import math
+import re
 import subprocess
-import json
 import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 # Version
 VERSION = "1.0.0"
@@ -35,6 +38,30 @@ TEMP_DIR = Path(tempfile.gettempdir()) / "flowstate_temp"
 EXPORTS_DIR.mkdir(exist_ok=True)
 TEMP_DIR.mkdir(exist_ok=True)
 
+# Mixes up to this long are looped in memory with aloop (~230 MB for 10
+# minutes); longer ones are looped from a temp file
+ALOOP_MAX_SECONDS = 600
+
+# Ceiling for the true peak after the static loudness gain, in dBTP
+TRUE_PEAK_CEILING_DB = -1.5
+
+# Filter graphs default to a single thread; give them every core
+CPU_COUNT = str(os.cpu_count() or 1)
+THREAD_ARGS = ["-filter_threads", CPU_COUNT, "-filter_complex_threads", CPU_COUNT]
+
+# Video track: black frame under the audio
+BLACK_VIDEO = "color=c=black:s=1920x1080:r=30"
+AUDIO_ARGS = ["-c:a", "aac", "-b:a", "192k"]
+
+# H.264 encoders in order of preference; detect_video_encoder() picks the
+# first one that works on this machine
+VIDEO_ENCODERS = {
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-b:v", "2M", "-allow_sw", "1",
+                          "-pix_fmt", "yuv420p"],
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p1", "-b:v", "2M", "-pix_fmt", "yuv420p"],
+    "libx264": ["-c:v", "libx264", "-preset", "medium", "-crf", "23", "-threads", "0"],
+}
+
 # Binaural presets
 BINAURAL_PRESETS = {
     "delta": {
@@ -82,6 +109,7 @@ class ProjectConfig:
     youtube_title: str = ""
     youtube_description: str = ""
     youtube_tags: str = ""
+    video_encoder: str = ""  # empty or unknown picks the best available
 
 
 def check_ffmpeg() -> bool:
@@ -97,16 +125,88 @@ def check_ffmpeg() -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
+def detect_video_encoder() -> str:
+    """
+    First H.264 encoder from VIDEO_ENCODERS that can actually encode here.
+    ffmpeg builds list hardware encoders whether or not the hardware is
+    present, so each candidate gets a tiny trial encode.
+    """
+    try:
+        listed = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return "libx264"
+    
+    for name, args in VIDEO_ENCODERS.items():
+        if name == "libx264" or f" {name} " not in listed:
+            continue
+        try:
+            trial = subprocess.run(
+                ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "color=c=black:s=256x256:r=30:d=0.2"]
+                + args + ["-f", "null", "-"], capture_output=True, timeout=15)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if trial.returncode == 0:
+            return name
+    return "libx264"
+
+
+def concat_list(files: List[str]) -> bytes:
+    """
+    ffmpeg concat demuxer list for `files`, to be fed through stdin.
+    Quotes are escaped, and file: URLs keep the entries from resolving
+    relative to pipe:.
+    """
+    lines = []
+    for path in files:
+        escaped = os.path.abspath(path).replace("'", "'\\''")
+        lines.append(f"file 'file:{escaped}'\n")
+    return "".join(lines).encode()
+
+
+def measure_loudness(input_args: List[str], pre_filter: str = "",
+                     stdin: Optional[bytes] = None) -> Tuple[float, float]:
+    """Integrated loudness (LUFS) and true peak (dBTP) of an input, from ffmpeg's ebur128 summary"""
+    ebur128 = "ebur128=peak=true:framelog=quiet"
+    af = f"{pre_filter},{ebur128}" if pre_filter else ebur128
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-nostats"] + input_args + ["-af", af, "-f", "null", "-"],
+        input=stdin, capture_output=True, check=True
+    )
+    # The summary comes last; per-frame lines are suppressed by framelog=quiet
+    stderr = result.stderr.decode(errors="replace")
+    loudness = re.findall(r"I:\s*(-?[\d.]+|-inf)\s*LUFS", stderr)
+    peaks = re.findall(r"Peak:\s*(-?[\d.]+|-inf)\s*dBFS", stderr)
+    if not loudness or loudness[-1] == "-inf":
+        raise ValueError("Cannot measure loudness (silent input?)")
+    peak = float(peaks[-1]) if peaks else 0.0
+    return float(loudness[-1]), peak
+
+
 def get_audio_duration(filepath: str) -> float:
     """Get duration of audio file in seconds"""
     cmd = [
         "ffprobe", "-v", "error",
         "-show_entries", "format=duration",
-        "-of", "json", filepath
+        "-of", "csv=p=0", filepath
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    data = json.loads(result.stdout)
-    return float(data['format']['duration'])
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+    if result.returncode != 0:
+        raise ValueError(result.stderr.strip() or f"ffprobe exited with {result.returncode}")
+    return float(result.stdout.strip())
+
+
+def binaural_period(base: float, beat: float, sample_rate: int = 48000) -> Optional[int]:
+    """
+    Samples after which both binaural tones complete whole cycles together.
+    The pair only needs rendering for this long and can then be looped;
+    None when the repeat would be impractically long.
+    """
+    period = math.lcm(*(
+        (Fraction(str(freq)) / sample_rate).denominator for freq in (base, base + beat)
+    ))
+    return period if period <= sample_rate * 10 else None
 
 
 def sanitize_filename(name: str) -> str:
@@ -154,127 +254,121 @@ class AudioPipeline:
         
         # Step 1: Analyze files
         self.progress("Analyzing audio files...", 5)
-        durations = []
-        for f in self.files:
+        def analyze(f):
             try:
-                dur = get_audio_duration(f)
-                durations.append(dur)
+                return get_audio_duration(f)
             except Exception as e:
                 raise ValueError(f"Cannot analyze {f}: {e}")
         
+        # Each probe is its own ffprobe process, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(8, len(self.files))) as pool:
+            durations = list(pool.map(analyze, self.files))
+        
         total_duration = sum(durations)
         self.progress(f"Found {len(self.files)} files, {total_duration/60:.1f} min total", 10)
         
-        # Step 2: Build sequenced audio
+        # Step 2: Sequence, binaural and mix in one ffmpeg graph
         self.progress("Building sequence...", 20)
-        sequenced = str(TEMP_DIR / "sequenced.wav")
+        preset = BINAURAL_PRESETS[self.config.binaural_preset]
+        target_duration = self.config.loop_hours * 3600
+        needs_loop = total_duration < target_duration
+        final_duration = target_duration if needs_loop else total_duration
+        # aloop holds everything it loops in memory, so long sequences are
+        # mixed to a temp file and looped from disk instead
+        loop_in_graph = needs_loop and total_duration <= ALOOP_MAX_SECONDS
+        
+        # An unknown name (e.g. a template saved on another machine) falls
+        # back to detection like an empty one
+        encoder = self.config.video_encoder
+        if encoder not in VIDEO_ENCODERS:
+            encoder = detect_video_encoder()
+        video_args = VIDEO_ENCODERS[encoder] + AUDIO_ARGS
+        
+        safe_name = sanitize_filename(self.config.project_name)
+        audio_out = str(EXPORTS_DIR / f"{safe_name}_master.wav")
+        video_out = str(EXPORTS_DIR / f"{safe_name}.mp4")
         
         if len(self.files) == 1:
             # Single file - add fade in/out
-            subprocess.run([
-                "ffmpeg", "-y", "-i", self.files[0],
-                "-af", f"afade=t=in:ss=0:d=3,afade=t=out:st={durations[0]-5}:d=5,aloudnorm=I={self.config.target_loudness_lufs}",
-                "-c:a", "pcm_s24le", sequenced
-            ], capture_output=True, check=True)
+            seq_input = ["-i", self.files[0]]
+            seq_stdin = None
+            seq_filter = f"afade=t=in:ss=0:d=3,afade=t=out:st={durations[0]-5}:d=5"
         else:
-            # Multiple files - concatenate
-            # Create concat file list
-            concat_list = str(TEMP_DIR / "concat_list.txt")
-            with open(concat_list, 'w') as f:
-                for filepath in self.files:
-                    f.write(f"file '{filepath}'\n")
-            
-            # Use concat demuxer
-            subprocess.run([
-                "ffmpeg", "-y", "-f", "concat", "-safe", "0",
-                "-i", concat_list,
-                "-af", f"aloudnorm=I={self.config.target_loudness_lufs}",
-                "-c:a", "pcm_s24le", sequenced
-            ], capture_output=True, check=True)
-            
-            os.remove(concat_list)
-        
-        self.temp_files.append(sequenced)
-        seq_duration = get_audio_duration(sequenced)
-        
-        # Step 3: Generate binaural beats
-        self.progress("Generating binaural beats...", 40)
-        preset = BINAURAL_PRESETS[self.config.binaural_preset]
-        binaural = str(TEMP_DIR / "binaural.wav")
-        
-        subprocess.run([
-            "ffmpeg", "-y",
+            # Multiple files - concatenate with the concat demuxer, the
+            # list going in through stdin
+            seq_input = ["-f", "concat", "-safe", "0", "-protocol_whitelist", "file,pipe",
+                         "-i", "pipe:0"]
+            seq_stdin = concat_list(self.files)
+            seq_filter = "anull"
+        
+        # Normalize with one static gain measured up front rather than
+        # loudnorm's much slower dynamic processing
+        self.progress("Measuring loudness...", 25)
+        loudness, peak = measure_loudness(seq_input, seq_filter, seq_stdin)
+        # Never push the true peak above the ceiling, even if that leaves
+        # quiet, dynamic material under the loudness target
+        gain_db = min(self.config.target_loudness_lufs - loudness, TRUE_PEAK_CEILING_DB - peak)
+        seq_filter += f",volume={gain_db:.2f}dB"
+        
+        binaural_inputs = [
             "-f", "lavfi",
             "-i", f"sine=frequency={preset['base']}:sample_rate=48000",
             "-f", "lavfi",
             "-i", f"sine=frequency={preset['base']+preset['beat']}:sample_rate=48000",
-            "-filter_complex", "[0:a][1:a]join=inputs=2:channel_layout=stereo",
-            "-t", str(seq_duration),
-            "-c:a", "pcm_s24le", binaural
-        ], capture_output=True, check=True)
-        
-        self.temp_files.append(binaural)
-        
-        # Step 4: Mix audio
-        self.progress("Mixing audio layers...", 60)
-        mixed = str(TEMP_DIR / "mixed.wav")
-        
-        subprocess.run([
-            "ffmpeg", "-y", "-i", sequenced, "-i", binaural,
-            "-filter_complex", 
-            f"[1:a]volume={self.config.binaural_volume_db}dB[bin];"
-            f"[0:a][bin]amix=inputs=2:duration=longest[outa]",
-            "-map", "[outa]",
-            "-c:a", "pcm_s24le", mixed
-        ], capture_output=True, check=True)
+        ]
         
-        self.temp_files.append(mixed)
+        # The tones repeat exactly, so one period is rendered and looped
+        period = binaural_period(preset['base'], preset['beat'])
+        tile = f",atrim=end_sample={period},aloop=loop=-1:size={period}" if period else ""
         
-        # Step 5: Loop if needed
-        target_duration = self.config.loop_hours * 3600
-        final_audio = mixed
+        graph = (
+            f"[0:a]{seq_filter},aresample=48000[seq];"
+            f"[1:a][2:a]join=inputs=2:channel_layout=stereo,"
+            f"volume={self.config.binaural_volume_db}dB{tile}[bin];"
+            f"[seq][bin]amix=inputs=2:duration=first"
+        )
         
-        if seq_duration < target_duration:
-            self.progress(f"Looping to {self.config.loop_hours} hours...", 75)
-            looped = str(TEMP_DIR / "looped.wav")
-            
-            # Calculate how many loops needed
-            loops_needed = int(target_duration / seq_duration) + 1
-            
+        if needs_loop and not loop_in_graph:
+            # Lossless temp at level 0: a fraction of the WAV's size and cheap to decode
+            mixed = str(TEMP_DIR / "mixed.flac")
+            subprocess.run(
+                ["ffmpeg", "-y"] + THREAD_ARGS + seq_input + binaural_inputs + [
+                    "-filter_complex", graph + "[outa]",
+                    "-map", "[outa]",
+                    "-c:a", "flac", "-compression_level", "0", mixed
+                ], input=seq_stdin, capture_output=True, check=True)
+            self.temp_files.append(mixed)
+            
+            # Step 3: Loop straight into both exports; one decode feeds the
+            # master WAV and the video, and no looped copy is materialized
+            self.progress(f"Looping to {self.config.loop_hours} hours...", 60)
+            duration = str(final_duration)
             subprocess.run([
-                "ffmpeg", "-y", "-stream_loop", str(loops_needed),
+                "ffmpeg", "-y", *THREAD_ARGS, "-stream_loop", "-1",
                 "-i", mixed,
-                "-t", str(target_duration),
-                "-c:a", "pcm_s24le", looped
-            ], capture_output=True, check=True)
-            
-            final_audio = looped
-            self.temp_files.append(looped)
-            final_duration = target_duration
+                "-f", "lavfi", "-i", BLACK_VIDEO,
+                "-map", "0:a", "-t", duration,
+                "-c:a", "pcm_s24le", audio_out,
+                "-map", "1:v", "-map", "0:a", "-t", duration,
+            ] + video_args + [video_out], capture_output=True, check=True)
         else:
-            final_duration = seq_duration
+            # Mix, loop and both exports in a single run, straight from the graph
+            self.progress("Rendering audio and video...", 40)
+            if loop_in_graph:
+                graph += ",aloop=loop=-1:size=2147483647"
+            graph += ",asplit=2[outa][vida]"
+            duration = str(final_duration)
+            
+            subprocess.run(
+                ["ffmpeg", "-y"] + THREAD_ARGS + seq_input + binaural_inputs + [
+                    "-f", "lavfi", "-i", BLACK_VIDEO,
+                    "-filter_complex", graph,
+                    "-map", "[outa]", "-t", duration,
+                    "-c:a", "pcm_s24le", audio_out,
+                    "-map", "3:v", "-map", "[vida]", "-t", duration,
+                ] + video_args + [video_out], input=seq_stdin, capture_output=True, check=True)
         
-        # Step 6: Export
-        self.progress("Exporting files...", 90)
-        safe_name = sanitize_filename(self.config.project_name)
-        
-        # Export audio
-        audio_out = str(EXPORTS_DIR / f"{safe_name}_master.wav")
-        shutil.copy2(final_audio, audio_out)
         results['audio'] = audio_out
-        
-        # Export video
-        video_out = str(EXPORTS_DIR / f"{safe_name}.mp4")
-        subprocess.run([
-            "ffmpeg", "-y",
-            "-f", "lavfi",
-            "-i", "color=c=black:s=1920x1080:r=30",
-            "-i", final_audio,
-            "-t", str(final_duration),
-            "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-            "-c:a", "aac", "-b:a", "192k",
-            "-shortest", video_out
-        ], capture_output=True, check=True)
         results['video'] = video_out
         
         # Export metadata